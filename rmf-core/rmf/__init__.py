@@ -25,9 +25,27 @@ from .logging import (
     JSONFormatter, 
     SafeRotatingFileHandler
 )
-from .config import Config, config
+from .config import Config
 from .env import EnvVarManager, env
-from .rmf import RMF
+
+# import時にサブモジュールとして束縛された名前を外し、
+# configシングルトンを__getattr__経由で遅延生成する
+del config
+
+
+def __getattr__(name):
+    """モジュール属性の遅延解決
+    
+    RMFはaiohttpなどの読み込みが重いため、初回アクセス時にimportします。
+    """
+    if name == 'config':
+        from .config import config
+        return config
+    if name == 'RMF':
+        from .rmf import RMF
+        globals()['RMF'] = RMF
+        return RMF
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 公開APIを明示的に列挙
 __all__ = [
@@ -7,12 +7,53 @@ import os
 import sys
 import time
 import shutil
+import stat
+import tempfile
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Final, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# 実行中にOSが変わることはないため、判定結果はインポート時に一度だけ求める
+_IS_WINDOWS: Final[bool] = os.name == 'nt'
+
+
+def _default_file_mode() -> Optional[int]:
+    """新規ファイルの既定のパーミッションを取得
+    
+    os.umask()での読み取りはプロセス全体のumaskを一時的に変更してしまうため、
+    /proc/self/status（Linuxのみ）から読み取ります。umaskは実行中に変更され得るため
+    キャッシュしません。
+    
+    Returns:
+        Optional[int]: umaskを適用したパーミッション。取得できない場合はNone
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return 0o666 & ~int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _resolve_path(path: str, cwd: str) -> str:
+    """パスを絶対パスに解決（結果をキャッシュ）
+    
+    Args:
+        path: 解決するパス
+        cwd: 相対パスの基準となるカレントディレクトリ（キャッシュのキーとしてのみ使用）
+    
+    Returns:
+        str: 解決されたパス
+    """
+    return str(Path(path).resolve())
+
 
 class PlatformUtils:
     """プラットフォーム固有の処理を抽象化するユーティリティクラス"""
@@ -20,7 +61,7 @@ class PlatformUtils:
     @staticmethod
     def is_windows():
         """Windows環境かどうかを判定"""
-        return os.name == 'nt'
+        return _IS_WINDOWS
     
     @staticmethod
     def get_safe_path(path):
@@ -32,8 +73,11 @@ class PlatformUtils:
         Returns:
             str: OS依存の形式に変換されたパス
         """
-        path_obj = Path(path)
-        return str(path_obj.resolve())
+        # 同じパスの解決はキャッシュを使用し、ファイルシステムへの問い合わせを省く
+        # 相対パスはカレントディレクトリごとに区別する
+        path_str = os.fspath(path)
+        cwd = '' if os.path.isabs(path_str) else os.getcwd()
+        return _resolve_path(path_str, cwd)
     
     @staticmethod
     def ensure_directory(path):
@@ -69,55 +113,95 @@ class PlatformUtils:
         for i in range(max_retries):
             try:
                 if i > 0:
-                    logger.debug(f"Retrying rmtree for {path} (attempt {i+1}/{max_retries})")
+                    logger.debug("Retrying rmtree for %s (attempt %d/%d)", path, i + 1, max_retries)
                 
                 # Windowsの場合、読み取り専用属性を解除
-                if PlatformUtils.is_windows():
-                    try:
-                        for item in path.rglob('*'):
-                            if item.is_file():
-                                item.chmod(0o777)
-                    except Exception as e:
-                        logger.debug(f"Failed to remove read-only attribute: {e}")
+                if _IS_WINDOWS:
+                    # Pathオブジェクトを生成せず、ファイルごとの追加のstatも行わない
+                    for root, _dirs, files in os.walk(path):
+                        for name in files:
+                            try:
+                                os.chmod(os.path.join(root, name), 0o777)
+                            except OSError as e:
+                                logger.debug("Failed to remove read-only attribute: %s", e)
                 
                 shutil.rmtree(path, ignore_errors=True)
                 if not path.exists():
                     return True
             except Exception as e:
-                logger.debug(f"Failed to remove directory {path}: {e}")
+                logger.debug("Failed to remove directory %s: %s", path, e)
                 if i < max_retries - 1:  # 最後の試行以外はリトライ
                     time.sleep(retry_delay)
         
         return not path.exists()
     
     @staticmethod
-    def safe_file_write(path, content, encoding='utf-8'):
+    def safe_file_write(path, content, encoding='utf-8', durable=True):
         """安全なファイル書き込み
         
+        一時ファイルに書き込んでから置き換えるため、書き込み途中で失敗しても
+        既存のファイルが壊れることはありません。
+        シンボリックリンクはリンク先のファイルを置き換え、既存ファイルの
+        パーミッションは引き継ぎます。
+        
         Args:
             path: 書き込み先ファイルパス
             content: 書き込む内容
             encoding: 文字エンコーディング
+            durable: Trueの場合、fsyncでディスクへの書き込みを保証する
         """
+        # シンボリックリンク自体を置き換えないよう、リンク先に解決する
+        path = Path(os.path.realpath(path))
+        
         # 親ディレクトリの作成
-        path = Path(path)
         PlatformUtils.ensure_directory(path.parent)
         
         # Windows環境での書き込み前の属性変更
-        if PlatformUtils.is_windows() and path.exists():
+        if _IS_WINDOWS and path.exists():
             try:
                 path.chmod(0o777)
             except Exception as e:
-                logger.debug(f"Failed to change file attributes: {e}")
+                logger.debug("Failed to change file attributes: %s", e)
         
-        # 書き込み処理
-        with open(path, 'w', encoding=encoding, newline='\n') as f:
-            f.write(content)
-            f.flush()
+        # 置き換え後も同じパーミッションになるよう、既存ファイルのモードを取得
+        # （新規ファイルはumaskに従う。umaskを取得できない場合はmkstempの0600のまま）
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = _default_file_mode()
+        
+        # 一時ファイルへの書き込み処理（mkstempで他プロセスやスレッドと名前が衝突しない）
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, 'w', encoding=encoding, newline='\n') as f:
+                f.write(content)
+                if durable:
+                    f.flush()
+                    try:
+                        os.fsync(f.fileno())  # 確実にディスクに書き込む
+                    except Exception as e:
+                        logger.debug("Failed to fsync file %s: %s", path, e)
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
             try:
-                os.fsync(f.fileno())  # 確実にディスクに書き込む
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        
+        # 置き換えたディレクトリエントリもディスクに書き込む（Windowsはディレクトリを開けない）
+        if durable and not _IS_WINDOWS:
+            try:
+                dir_fd = os.open(path.parent, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
             except Exception as e:
-                logger.debug(f"Failed to fsync file {path}: {e}")
+                logger.debug("Failed to fsync directory %s: %s", path.parent, e)
     
     @staticmethod
     def safe_file_read(path, encoding='utf-8'):
@@ -137,14 +221,14 @@ class PlatformUtils:
             
         try:
             # Windows環境での読み込み前の属性変更
-            if PlatformUtils.is_windows():
+            if _IS_WINDOWS:
                 try:
                     path.chmod(0o777)
                 except Exception as e:
-                    logger.debug(f"Failed to change file attributes: {e}")
+                    logger.debug("Failed to change file attributes: %s", e)
             
-            with open(path, 'r', encoding=encoding) as f:
-                return f.read()
+            # ファイルサイズに合わせて一度に読み込む
+            return path.read_text(encoding=encoding)
         except Exception as e:
-            logger.debug(f"Failed to read file {path}: {e}")
+            logger.debug("Failed to read file %s: %s", path, e)
             return None 
\ No newline at end of file
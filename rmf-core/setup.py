@@ -9,9 +9,14 @@ setup(
         "pyyaml>=6.0.0",
         "tenacity>=8.0.0",
         "aiohttp-sse>=2.1.0",
-        "backoff>=2.2.0",
         "pydantic>=2.3.0"
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "aiodns>=3.0.0",
+        ],
+    },
     author="Your Name",
     author_email="your.email@example.com",
     description="Remote MCP Fetcher Core Library",
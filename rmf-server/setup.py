@@ -11,6 +11,11 @@ setup(
         "pydantic>=2.3.0"
     ],
     extras_require={
+        "fast": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "httptools>=0.5.0",
+            "orjson>=3.8.0"
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.18.0",
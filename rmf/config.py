@@ -19,164 +19,324 @@ MCP設定:
 - RMF_LOG_FILE: ログファイル名
 
 サーバー設定:
-- RMF_SERVER_SSE_ENABLED: SSE有効化フラグ
+- RMF_SERVER_SSE_ENABLED: SSE有効化フラグ (true/yes/1/y/on, false/no/0/n/off)
 - RMF_SERVER_SSE_RETRY_TIMEOUT: SSEリトライタイムアウト（ミリ秒）
 - RMF_SERVER_MAX_CONCURRENT_REQUESTS: 最大同時リクエスト数
 """
 
 import os
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
 import json
 import logging
+from functools import lru_cache
 from .errors import ConfigError
+from .env import _parse_bool, _TRUE_VALUES
 from .logging import setup_logging, log_error, get_logger
 
-def safe_int(value: str, default: int, param_name: str) -> int:
-    """安全に整数に変換"""
+@lru_cache(maxsize=128)
+def _parse_int_text(text: str) -> Optional[int]:
+    """文字列を整数に変換（結果をキャッシュ）
+    
+    Args:
+        text: 変換する文字列
+    
+    Returns:
+        Optional[int]: 変換結果。変換できない場合はNone
+    """
     try:
-        return int(value)
-    except (ValueError, TypeError):
-        raise ConfigError(
-            f"Invalid integer value for {param_name}: {value}",
-            {'parameter': param_name, 'value': value, 'expected_type': 'integer'}
-        )
+        return int(text)
+    except ValueError:
+        return None
 
-def safe_float(value: str, default: float, param_name: str) -> float:
-    """安全に浮動小数点数に変換"""
+@lru_cache(maxsize=128)
+def _parse_float_text(text: str) -> Optional[float]:
+    """文字列を浮動小数点数に変換（結果をキャッシュ）
+    
+    Args:
+        text: 変換する文字列
+    
+    Returns:
+        Optional[float]: 変換結果。変換できない場合はNone
+    """
     try:
-        return float(value)
-    except (ValueError, TypeError):
-        raise ConfigError(
-            f"Invalid float value for {param_name}: {value}",
-            {'parameter': param_name, 'value': value, 'expected_type': 'float'}
-        )
+        return float(text)
+    except ValueError:
+        return None
+
+def safe_int(value: str, default: int, param_name: str) -> int:
+    """安全に整数に変換
+    
+    値がNoneの場合は変換せずにデフォルト値を返します。
+    文字列の変換結果はキャッシュされ、同じ値の再変換を省きます。
+    """
+    if value is None:
+        return default
+    if isinstance(value, str):
+        result = _parse_int_text(value)
+        if result is not None:
+            return result
+    else:
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            pass
+    raise ConfigError(
+        f"Invalid integer value for {param_name}: {value}",
+        {'parameter': param_name, 'value': value, 'expected_type': 'integer'}
+    )
+
+def safe_float(value: str, default: float, param_name: str) -> float:
+    """安全に浮動小数点数に変換
+    
+    値がNoneの場合は変換せずにデフォルト値を返します。
+    文字列の変換結果はキャッシュされ、同じ値の再変換を省きます。
+    """
+    if value is None:
+        return default
+    if isinstance(value, str):
+        result = _parse_float_text(value)
+        if result is not None:
+            return result
+    else:
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            pass
+    raise ConfigError(
+        f"Invalid float value for {param_name}: {value}",
+        {'parameter': param_name, 'value': value, 'expected_type': 'float'}
+    )
+
+def safe_bool(value: str, default: bool, param_name: str) -> bool:
+    """安全に真偽値に変換
+    
+    値がNoneの場合は変換せずにデフォルト値を返します。
+    """
+    if value is None:
+        return default
+    return _parse_bool(value, param_name)
+
+def _safe_flag(value: str, default: bool, param_name: str) -> bool:
+    """有効化フラグに変換
+    
+    safe_boolと異なり不正な値でもエラーにせず、真の値以外はすべてFalseとします。
+    値がNoneの場合は変換せずにデフォルト値を返します。
+    """
+    if value is None:
+        return default
+    return value.lower() in _TRUE_VALUES
+
+# 環境変数の定義
+# セクション -> ((属性名, 環境変数名, 変換関数, デフォルト値), ...)
+# 変換関数がNoneの項目は文字列のまま扱う
+_ENV_SPEC: Dict[str, Tuple[Tuple[str, str, Optional[Callable[[str, Any, str], Any]], Any], ...]] = {
+    'mcp': (
+        ('base_url', 'RMF_MCP_BASE_URL', None, 'http://localhost:8003'),
+        ('timeout', 'RMF_MCP_TIMEOUT', safe_int, 5),
+    ),
+    'retry': (
+        ('max_attempts', 'RMF_MCP_RETRY_MAX_ATTEMPTS', safe_int, 3),
+        ('initial_delay', 'RMF_MCP_RETRY_INITIAL_DELAY', safe_float, 0.1),
+        ('max_delay', 'RMF_MCP_RETRY_MAX_DELAY', safe_float, 1.0),
+    ),
+    'logging': (
+        ('level', 'RMF_LOG_LEVEL', None, 'INFO'),
+        ('format', 'RMF_LOG_FORMAT', None, 'json'),
+        ('file', 'RMF_LOG_FILE', None, 'rmf.log'),
+    ),
+    'server': (
+        ('sse_enabled', 'RMF_SERVER_SSE_ENABLED', _safe_flag, True),
+        ('sse_retry_timeout', 'RMF_SERVER_SSE_RETRY_TIMEOUT', safe_int, 3000),
+        ('max_concurrent_requests', 'RMF_SERVER_MAX_CONCURRENT_REQUESTS', safe_int, 10),
+    ),
+}
+
+# 認識する環境変数の一覧（環境変数名 -> (セクション, 属性名)）
+_ENV_ROUTES: Dict[str, Tuple[str, str]] = {
+    env_name: (section, attr)
+    for section, fields in _ENV_SPEC.items()
+    for attr, env_name, _, _ in fields
+}
+
+def _read_env_overrides(environ: Mapping[str, str] = os.environ) -> Dict[str, Dict[str, str]]:
+    """設定済みの環境変数をセクションごとに取得
+    
+    環境全体を走査せず、登録済みの環境変数だけを参照します。
+    
+    Args:
+        environ: 参照する環境変数（スナップショットの辞書も指定可能）
+    
+    Returns:
+        セクション名 -> {属性名: 環境変数の値} の辞書
+    """
+    overrides: Dict[str, Dict[str, str]] = {section: {} for section in _ENV_SPEC}
+    for env_name, (section, key) in _ENV_ROUTES.items():
+        value = environ.get(env_name)
+        if value is not None:
+            overrides[section][key] = value
+    return overrides
+
+def _load_section(target: Any, section: str, overrides: Dict[str, Dict[str, str]]) -> None:
+    """定義表に従ってセクションの設定値を変換・設定
+    
+    Args:
+        target: 設定値を書き込むオブジェクト
+        section: セクション名
+        overrides: _read_env_overrides()の結果
+        
+    Raises:
+        ConfigError: 値の変換に失敗した場合
+    """
+    values = overrides[section]
+    for attr, env_name, parser, default in _ENV_SPEC[section]:
+        raw = values.get(attr)
+        if raw is None:
+            value = default
+        elif parser is None:
+            value = raw
+        else:
+            value = parser(raw, default, env_name)
+        setattr(target, attr, value)
+
+def _as_dict(section: Any) -> Dict[str, Any]:
+    """設定オブジェクトを辞書に変換
+    
+    初期化途中で未設定の属性はNoneとして扱います。
+    """
+    result = {}
+    for name in section.__slots__:
+        value = getattr(section, name, None)
+        result[name] = _as_dict(value) if hasattr(value, '__slots__') else value
+    return result
 
-@dataclass
 class RetryConfig:
     """リトライ設定"""
-    def __init__(self):
-        self.max_attempts = safe_int(
-            os.getenv('RMF_MCP_RETRY_MAX_ATTEMPTS', '3'),
-            3,
-            'RMF_MCP_RETRY_MAX_ATTEMPTS'
-        )
-        self.initial_delay = safe_float(
-            os.getenv('RMF_MCP_RETRY_INITIAL_DELAY', '0.1'),
-            0.1,
-            'RMF_MCP_RETRY_INITIAL_DELAY'
-        )
-        self.max_delay = safe_float(
-            os.getenv('RMF_MCP_RETRY_MAX_DELAY', '1.0'),
-            1.0,
-            'RMF_MCP_RETRY_MAX_DELAY'
-        )
+    __slots__ = ('max_attempts', 'initial_delay', 'max_delay')
+    
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, str]]] = None):
+        _load_section(self, 'retry', overrides or _read_env_overrides())
 
-@dataclass
 class MCPConfig:
     """MCP設定"""
-    def __init__(self):
+    __slots__ = ('name', 'namespace', 'base_url', 'timeout', 'retry', 'headers')
+    
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, str]]] = None):
+        overrides = overrides or _read_env_overrides()
         self.name = "Text Processing MCP"
-        self.base_url = os.getenv('RMF_MCP_BASE_URL', 'http://localhost:8003')
         self.namespace = "text"
-        self.timeout = safe_int(
-            os.getenv('RMF_MCP_TIMEOUT', '5'),
-            5,
-            'RMF_MCP_TIMEOUT'
-        )
-        self.retry = RetryConfig()
+        _load_section(self, 'mcp', overrides)
+        self.retry = RetryConfig(overrides)
         self.headers = ""
 
-@dataclass
 class LoggingConfig:
     """ロギング設定"""
-    def __init__(self):
-        self.level = os.getenv('RMF_LOG_LEVEL', 'INFO')
-        self.format = os.getenv('RMF_LOG_FORMAT', 'json')
-        self.file = os.getenv('RMF_LOG_FILE', 'rmf.log')
+    __slots__ = ('level', 'format', 'file')
+    
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, str]]] = None):
+        _load_section(self, 'logging', overrides or _read_env_overrides())
 
-@dataclass
 class ServerConfig:
     """サーバー設定"""
-    def __init__(self):
-        self.sse_enabled = os.getenv('RMF_SERVER_SSE_ENABLED', 'true').lower() == 'true'
-        self.sse_retry_timeout = safe_int(
-            os.getenv('RMF_SERVER_SSE_RETRY_TIMEOUT', '3000'),
-            3000,
-            'RMF_SERVER_SSE_RETRY_TIMEOUT'
-        )
-        self.max_concurrent_requests = safe_int(
-            os.getenv('RMF_SERVER_MAX_CONCURRENT_REQUESTS', '10'),
-            10,
-            'RMF_SERVER_MAX_CONCURRENT_REQUESTS'
-        )
+    __slots__ = ('sse_enabled', 'sse_retry_timeout', 'max_concurrent_requests')
+    
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, str]]] = None):
+        _load_section(self, 'server', overrides or _read_env_overrides())
+
+# 実行環境ごとの設定上書き（productionは上書きなし）
+_ENV_OVERRIDES: Dict[str, Dict[str, Any]] = {
+    'test': {
+        'label': 'Test',
+        'log_level': 'DEBUG',
+        'log_file': 'rmf_test.log',
+        'sse_retry_timeout': 1000,
+        'max_concurrent_requests': 5,
+    },
+    'development': {
+        'label': 'Development',
+        'log_level': 'DEBUG',
+        'log_file': 'rmf_dev.log',
+        'sse_retry_timeout': 1500,
+        'max_concurrent_requests': 3,
+    },
+}
 
 class Config:
     """設定管理クラス"""
     
     def __init__(self):
-        self._env = os.getenv('RMF_ENV', 'production')
+        # 実行環境と登録済みの環境変数を同じ参照元から一度だけ読み込む
+        environ = os.environ
+        self._env = environ.get('RMF_ENV', 'production')
         self._logger = None
+        overrides = _read_env_overrides(environ)
         
         try:
             # 先にロギング設定を初期化（他の設定よりも優先）
-            self._logging_config = LoggingConfig()
+            self._logging_config = LoggingConfig(overrides)
             
             # ロガーの初期化（他の設定より先に行う）
             self._setup_logger()
             
             # 残りの設定を初期化
             try:
-                self._mcp_config = MCPConfig()
+                self._mcp_config = MCPConfig(overrides)
             except ConfigError as e:
                 # MCPConfig初期化エラーをログ出力
                 if self._logger:
-                    error_details = {
-                        'environment': self._env,
-                        'error_code': getattr(e, 'error_code', 'UNKNOWN'),
-                        'parameter': getattr(e, 'details', {}).get('parameter', 'UNKNOWN'),
-                        'value': getattr(e, 'details', {}).get('value', 'UNKNOWN'),
-                        'expected_type': getattr(e, 'details', {}).get('expected_type', 'UNKNOWN')
-                    }
-                    self._logger.error(str(e), error=e, details=error_details)
+                    self._logger.error(str(e), error=e, details=self._error_details(e))
                 raise
             
-            self._server_config = ServerConfig()
+            self._server_config = ServerConfig(overrides)
             
             # 環境に応じた設定の調整
             self._adjust_config_for_environment()
             
+            # プロパティで返す設定辞書を構築（以降は不変）
+            self._build_views()
+            
             # 設定読み込み成功のログを出力
-            details = {
-                'environment': self._env,
-                'mcp_base_url': self._mcp_config.base_url,
-                'log_level': self._logging_config.level,
-                'log_file': self._logging_config.file,
-                'server': {
-                    'sse_enabled': self._server_config.sse_enabled,
-                    'sse_retry_timeout': self._server_config.sse_retry_timeout,
-                    'max_concurrent_requests': self._server_config.max_concurrent_requests
+            if self._logger.isEnabledFor(logging.INFO):
+                details = {
+                    'environment': self._env,
+                    'mcp_base_url': self._mcp_config.base_url,
+                    'log_level': self._logging_config.level,
+                    'log_file': self._logging_config.file,
+                    'server': self._server
                 }
-            }
-            self._logger.info("Configuration loaded successfully", details=details)
+                self._logger.info("Configuration loaded successfully", details=details)
         
         except ConfigError as e:
             if self._logger:
-                error_details = {
-                    'environment': self._env,
-                    'error_code': getattr(e, 'error_code', 'UNKNOWN'),
-                    'parameter': getattr(e, 'details', {}).get('parameter', 'UNKNOWN'),
-                    'value': getattr(e, 'details', {}).get('value', 'UNKNOWN'),
-                    'expected_type': getattr(e, 'details', {}).get('expected_type', 'UNKNOWN'),
-                    'config_state': {
-                        'logging_config': self._logging_config.__dict__ if hasattr(self, '_logging_config') else None,
-                        'mcp_config': self._mcp_config.__dict__ if hasattr(self, '_mcp_config') else None,
-                        'server_config': self._server_config.__dict__ if hasattr(self, '_server_config') else None
-                    }
+                error_details = self._error_details(e)
+                error_details['config_state'] = {
+                    name: _as_dict(section) if section is not None else None
+                    for name, section in (
+                        ('logging_config', getattr(self, '_logging_config', None)),
+                        ('mcp_config', getattr(self, '_mcp_config', None)),
+                        ('server_config', getattr(self, '_server_config', None))
+                    )
                 }
                 self._logger.error(str(e), error=e, details=error_details)
             raise
     
+    def _error_details(self, error: ConfigError) -> Dict[str, Any]:
+        """設定エラーのログ用詳細情報を構築
+        
+        Args:
+            error: 設定エラー
+            
+        Returns:
+            ログに付加する詳細情報
+        """
+        details = getattr(error, 'details', None) or {}
+        return {
+            'environment': self._env,
+            'error_code': getattr(error, 'error_code', 'UNKNOWN'),
+            'parameter': details.get('parameter', 'UNKNOWN'),
+            'value': details.get('value', 'UNKNOWN'),
+            'expected_type': details.get('expected_type', 'UNKNOWN')
+        }
+    
     def _setup_logger(self):
         """ロガーの設定"""
         try:
@@ -201,27 +361,18 @@ class Config:
     
     def _adjust_config_for_environment(self):
         """環境に応じて設定を調整"""
-        if self._env == 'test':
-            self._logging_config.level = 'DEBUG'
-            self._logging_config.file = 'rmf_test.log'
-            self._server_config.sse_retry_timeout = 1000
-            self._server_config.max_concurrent_requests = 5
-            self._logger.debug("Test environment configuration applied", details={
-                'environment': 'test',
-                'log_level': self._logging_config.level,
-                'log_file': self._logging_config.file,
-                'server_config': {
-                    'sse_retry_timeout': self._server_config.sse_retry_timeout,
-                    'max_concurrent_requests': self._server_config.max_concurrent_requests
-                }
-            })
-        elif self._env == 'development':
-            self._logging_config.level = 'DEBUG'
-            self._logging_config.file = 'rmf_dev.log'
-            self._server_config.sse_retry_timeout = 1500
-            self._server_config.max_concurrent_requests = 3
-            self._logger.debug("Development environment configuration applied", details={
-                'environment': 'development',
+        overrides = _ENV_OVERRIDES.get(self._env)
+        if not overrides:
+            return
+        
+        self._logging_config.level = overrides['log_level']
+        self._logging_config.file = overrides['log_file']
+        self._server_config.sse_retry_timeout = overrides['sse_retry_timeout']
+        self._server_config.max_concurrent_requests = overrides['max_concurrent_requests']
+        
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("%s environment configuration applied", overrides['label'], details={
+                'environment': self._env,
                 'log_level': self._logging_config.level,
                 'log_file': self._logging_config.file,
                 'server_config': {
@@ -230,10 +381,15 @@ class Config:
                 }
             })
     
-    @property
-    def remote_mcps(self) -> List[Dict[str, Any]]:
-        """リモートMCPの設定を取得"""
-        return [{
+    def _build_views(self):
+        """プロパティで返す設定辞書を構築
+        
+        設定は初期化後に変化しないため、アクセスのたびに辞書を
+        作り直さず、ここで一度だけ構築したものを返します。
+        既存の呼び出し側との互換性のため通常の辞書・リストのままとし、
+        変更が必要な呼び出し側にはget_config()のコピーを使用してもらいます。
+        """
+        self._remote_mcps = [{
             'name': self._mcp_config.name,
             'base_url': self._mcp_config.base_url,
             'namespace': self._mcp_config.namespace,
@@ -245,32 +401,60 @@ class Config:
             },
             'headers': self._mcp_config.headers
         }]
-    
-    @property
-    def logging(self) -> Dict[str, Any]:
-        """ロギングの設定を取得"""
-        return {
+        self._logging = {
             'level': self._logging_config.level,
             'format': self._logging_config.format,
             'file': self._logging_config.file
         }
-    
-    @property
-    def server(self) -> Dict[str, Any]:
-        """サーバーの設定を取得"""
-        return {
+        self._server = {
             'sse_enabled': self._server_config.sse_enabled,
             'sse_retry_timeout': self._server_config.sse_retry_timeout,
             'max_concurrent_requests': self._server_config.max_concurrent_requests
         }
     
+    @property
+    def remote_mcps(self) -> List[Dict[str, Any]]:
+        """リモートMCPの設定を取得（共有されるため変更しないこと）"""
+        return self._remote_mcps
+    
+    @property
+    def logging(self) -> Dict[str, Any]:
+        """ロギングの設定を取得（共有されるため変更しないこと）"""
+        return self._logging
+    
+    @property
+    def server(self) -> Dict[str, Any]:
+        """サーバーの設定を取得（共有されるため変更しないこと）"""
+        return self._server
+    
     def get_config(self) -> Dict[str, Any]:
-        """全ての設定を取得"""
+        """全ての設定を取得
+        
+        プロパティの辞書は共有されるため、呼び出し側で変更できるよう
+        呼び出しごとに新しい辞書として返します。
+        """
         return {
-            'remote_mcps': self.remote_mcps,
-            'logging': self.logging,
-            'server': self.server
+            'remote_mcps': [
+                {**mcp, 'retry': dict(mcp['retry'])}
+                for mcp in self._remote_mcps
+            ],
+            'logging': dict(self._logging),
+            'server': dict(self._server)
         }
 
-# シングルトンインスタンス
-config = Config() 
\ No newline at end of file
+# シングルトンインスタンス（初回アクセス時に生成）
+_config = None
+
+
+def __getattr__(name: str) -> Any:
+    """モジュール属性の遅延解決
+    
+    configシングルトンは初回アクセス時に生成し、import時の
+    環境変数解析やログファイル作成を避けます。
+    """
+    if name == 'config':
+        global _config
+        if _config is None:
+            _config = Config()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
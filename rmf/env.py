@@ -4,17 +4,98 @@
 """
 
 import os
-from typing import Dict, Any, Optional, List, Union, TypeVar, Generic, Callable, Type, cast
+from typing import Dict, Any, Optional, List, Tuple, Union, TypeVar, Generic, Callable, Type, cast
 from .errors import ConfigError
 
 
 T = TypeVar('T')
 
+# 真偽値として扱う文字列（小文字）
+_TRUE_VALUES = frozenset({'true', 'yes', '1', 'y', 'on'})
+_FALSE_VALUES = frozenset({'false', 'no', '0', 'n', 'off'})
+
+
+def _parse_int(value: str, full_key: str) -> int:
+    """整数に変換"""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        raise ConfigError(
+            f"Invalid integer value for {full_key}: {value}",
+            {'parameter': full_key, 'value': value, 'expected_type': 'integer'}
+        )
+
+
+def _parse_float(value: str, full_key: str) -> float:
+    """浮動小数点数に変換"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        raise ConfigError(
+            f"Invalid float value for {full_key}: {value}",
+            {'parameter': full_key, 'value': value, 'expected_type': 'float'}
+        )
+
+
+def _parse_bool(value: str, full_key: str) -> bool:
+    """真偽値に変換"""
+    value_lower = value.lower()
+    
+    if value_lower in _TRUE_VALUES:
+        return True
+    elif value_lower in _FALSE_VALUES:
+        return False
+    else:
+        raise ConfigError(
+            f"Invalid boolean value for {full_key}: {value}",
+            {'parameter': full_key, 'value': value, 'expected_type': 'boolean'}
+        )
+
+
+def _parse_list(value: str, full_key: str, separator: str) -> List[str]:
+    """リストに変換"""
+    # 空の値のときは空リストを返す
+    if not value.strip():
+        return []
+    
+    # カンマ区切りの値をリストに変換
+    return [item.strip() for item in value.split(separator) if item.strip()]
+
+
+def _parse_dict(value: str, full_key: str, item_separator: str, key_value_separator: str) -> Dict[str, str]:
+    """辞書に変換"""
+    # 空の値のときは空辞書を返す
+    if not value.strip():
+        return {}
+    
+    result = {}
+    
+    # カンマ区切りの値を処理
+    for item in value.split(item_separator):
+        # key=value形式に分割（partitionは中間リストを作らない）
+        k, sep, v = item.partition(key_value_separator)
+        if not sep:
+            if not item.strip():
+                continue
+            raise ConfigError(
+                f"Invalid dictionary format for {full_key}: {value}",
+                {
+                    'parameter': full_key,
+                    'value': value,
+                    'expected_type': 'dictionary',
+                    'error': f"Invalid key-value pair: {item.strip()}"
+                }
+            )
+        result[k.strip()] = v.strip()
+    
+    return result
+
 
 class EnvVarManager:
     """環境変数管理クラス
     
     環境変数の取得と型変換を行います。
+    変換結果は元の文字列と組にしてキャッシュし、値が変わらない限り再変換しません。
     """
     
     def __init__(self, prefix: str = 'RMF_'):
@@ -23,7 +104,69 @@ class EnvVarManager:
         Args:
             prefix: 環境変数のプレフィックス
         """
-        self.prefix = prefix
+        self._prefix = prefix
+        # キー -> プレフィックス付きの環境変数名
+        self._key_cache: Dict[str, str] = {}
+        # (環境変数名, 変換関数, 追加引数) -> (元の文字列, 変換結果)
+        self._cache: Dict[Tuple[Any, ...], Tuple[str, Any]] = {}
+    
+    @property
+    def prefix(self) -> str:
+        """環境変数のプレフィックス"""
+        return self._prefix
+    
+    @prefix.setter
+    def prefix(self, value: str) -> None:
+        self._prefix = value
+        self._key_cache.clear()
+        self._cache.clear()
+    
+    def _full_key(self, key: str) -> str:
+        """プレフィックス付きの環境変数名を取得
+        
+        Args:
+            key: 環境変数名（プレフィックスを除く部分）
+            
+        Returns:
+            プレフィックスを含む環境変数名
+        """
+        full_key = self._key_cache.get(key)
+        if full_key is None:
+            full_key = self._key_cache[key] = self._prefix + key
+        return full_key
+    
+    def _parse_cached(self, full_key: str, value: str, parser: Callable[..., T], *args: Any) -> T:
+        """キャッシュを経由して環境変数の値を変換
+        
+        キャッシュは元の文字列と照合するため、os.environが外部から
+        変更された場合でも古い変換結果を返すことはありません。
+        
+        Args:
+            full_key: 環境変数名（プレフィックスを含む）
+            value: 環境変数の値
+            parser: 変換関数
+            *args: 変換関数への追加引数（区切り文字など）
+            
+        Returns:
+            変換された値
+        """
+        cache_key = (full_key, parser, args)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        
+        parsed = parser(value, full_key, *args)
+        self._cache[cache_key] = (value, parsed)
+        return parsed
+    
+    def _invalidate(self, full_key: str) -> None:
+        """指定した環境変数のキャッシュを破棄
+        
+        Args:
+            full_key: 環境変数名（プレフィックスを含む）
+        """
+        for cache_key in [k for k in self._cache if k[0] == full_key]:
+            del self._cache[cache_key]
     
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """環境変数を取得
@@ -35,7 +178,7 @@ class EnvVarManager:
         Returns:
             環境変数の値またはデフォルト値
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         return os.environ.get(full_key, default)
     
     def get_required(self, key: str) -> str:
@@ -50,7 +193,7 @@ class EnvVarManager:
         Raises:
             ConfigError: 環境変数が設定されていない場合
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         value = os.environ.get(full_key)
         
         if value is None:
@@ -74,19 +217,13 @@ class EnvVarManager:
         Raises:
             ConfigError: 環境変数の値が整数に変換できない場合
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         value = os.environ.get(full_key)
         
         if value is None:
             return default
         
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            raise ConfigError(
-                f"Invalid integer value for {full_key}: {value}",
-                {'parameter': full_key, 'value': value, 'expected_type': 'integer'}
-            )
+        return self._parse_cached(full_key, value, _parse_int)
     
     def get_float(self, key: str, default: float) -> float:
         """浮動小数点値の環境変数を取得
@@ -101,19 +238,13 @@ class EnvVarManager:
         Raises:
             ConfigError: 環境変数の値が浮動小数点数に変換できない場合
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         value = os.environ.get(full_key)
         
         if value is None:
             return default
         
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            raise ConfigError(
-                f"Invalid float value for {full_key}: {value}",
-                {'parameter': full_key, 'value': value, 'expected_type': 'float'}
-            )
+        return self._parse_cached(full_key, value, _parse_float)
     
     def get_bool(self, key: str, default: bool) -> bool:
         """真偽値の環境変数を取得
@@ -131,26 +262,13 @@ class EnvVarManager:
         Raises:
             ConfigError: 環境変数の値が真偽値に変換できない場合
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         value = os.environ.get(full_key)
         
         if value is None:
             return default
         
-        true_values = ['true', 'yes', '1', 'y', 'on']
-        false_values = ['false', 'no', '0', 'n', 'off']
-        
-        value_lower = value.lower()
-        
-        if value_lower in true_values:
-            return True
-        elif value_lower in false_values:
-            return False
-        else:
-            raise ConfigError(
-                f"Invalid boolean value for {full_key}: {value}",
-                {'parameter': full_key, 'value': value, 'expected_type': 'boolean'}
-            )
+        return self._parse_cached(full_key, value, _parse_bool)
     
     def get_list(self, key: str, default: List[str], separator: str = ',') -> List[str]:
         """リスト形式の環境変数を取得
@@ -165,18 +283,14 @@ class EnvVarManager:
         Returns:
             リストに変換された環境変数の値またはデフォルト値
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         value = os.environ.get(full_key)
         
         if value is None:
             return default
         
-        # 空の値のときは空リストを返す
-        if not value.strip():
-            return []
-        
-        # カンマ区切りの値をリストに変換
-        return [item.strip() for item in value.split(separator) if item.strip()]
+        # キャッシュしたリストを呼び出し側が変更しないようコピーを返す
+        return list(self._parse_cached(full_key, value, _parse_list, separator))
     
     def get_dict(self, key: str, default: Dict[str, str], item_separator: str = ',', key_value_separator: str = '=') -> Dict[str, str]:
         """辞書形式の環境変数を取得
@@ -195,39 +309,14 @@ class EnvVarManager:
         Raises:
             ConfigError: 環境変数の値が辞書形式に変換できない場合
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         value = os.environ.get(full_key)
         
         if value is None:
             return default
         
-        # 空の値のときは空辞書を返す
-        if not value.strip():
-            return {}
-        
-        result = {}
-        
-        try:
-            # カンマ区切りの値を処理
-            for item in value.split(item_separator):
-                item = item.strip()
-                if not item:
-                    continue
-                
-                # key=value形式に分割
-                if key_value_separator not in item:
-                    raise ValueError(f"Invalid key-value pair: {item}")
-                
-                k, v = item.split(key_value_separator, 1)
-                result[k.strip()] = v.strip()
-            
-            return result
-        
-        except Exception as e:
-            raise ConfigError(
-                f"Invalid dictionary format for {full_key}: {value}",
-                {'parameter': full_key, 'value': value, 'expected_type': 'dictionary', 'error': str(e)}
-            )
+        # キャッシュした辞書を呼び出し側が変更しないようコピーを返す
+        return dict(self._parse_cached(full_key, value, _parse_dict, item_separator, key_value_separator))
     
     def set(self, key: str, value: Any) -> None:
         """環境変数を設定
@@ -236,8 +325,9 @@ class EnvVarManager:
             key: 環境変数名（プレフィックスを除く部分）
             value: 設定する値
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         os.environ[full_key] = str(value)
+        self._invalidate(full_key)
     
     def clear(self, key: str) -> None:
         """環境変数をクリア
@@ -245,15 +335,17 @@ class EnvVarManager:
         Args:
             key: 環境変数名（プレフィックスを除く部分）
         """
-        full_key = f"{self.prefix}{key}"
+        full_key = self._full_key(key)
         if full_key in os.environ:
             del os.environ[full_key]
+        self._invalidate(full_key)
     
     def clear_all(self) -> None:
         """プレフィックスに一致するすべての環境変数をクリア"""
         for key in list(os.environ.keys()):
             if key.startswith(self.prefix):
                 del os.environ[key]
+        self._cache.clear()
 
 
 # シングルトンインスタンス
@@ -15,6 +15,7 @@ BaseError (基底クラス)
 """
 
 from typing import Dict, Any, Optional, List, Type
+import logging
 import traceback
 import sys
 from .logging import StructuredLogger
@@ -28,10 +29,19 @@ class BaseError(Exception):
     
     Attributes:
         error_code: エラーコード
+        error_type_name: エラー種別名（クラス名）
         message: エラーメッセージ
         details: エラーの詳細情報
     """
+    # インスタンスごとの__dict__を作らず、属性をスロットに保持する
+    __slots__ = ('message', 'details', '_str')
     error_code = 'UNKNOWN'
+    error_type_name = 'BaseError'
+    
+    def __init_subclass__(cls, **kwargs):
+        """サブクラス定義時にエラー種別名をクラス属性として設定"""
+        super().__init_subclass__(**kwargs)
+        cls.error_type_name = cls.__name__
     
     def __init__(self, message: str, details: Dict[str, Any] = None):
         """初期化
@@ -43,14 +53,30 @@ class BaseError(Exception):
         super().__init__(message)
         self.message = message
         self.details = details or {}
+        self._str = None
+    
+    def __reduce__(self):
+        """pickle・copy用の復元情報
+        
+        スロットの属性はBaseExceptionの既定の復元処理では引き継がれないため、
+        メッセージと詳細情報をコンストラクタの引数として渡します。
+        
+        Returns:
+            クラス、コンストラクタの引数、インスタンスの辞書
+        """
+        return (type(self), (self.message, self.details), self.__dict__ or None)
     
     def __str__(self) -> str:
         """文字列表現
         
+        初回の呼び出し時に作成した文字列を以降も再利用します。
+        
         Returns:
             エラーコードとメッセージを含む文字列
         """
-        return f"[{self.error_code}] {self.message}"
+        if self._str is None:
+            self._str = f"[{self.error_code}] {self.message}"
+        return self._str
 
 
 class RMFError(BaseError):
@@ -59,6 +85,7 @@ class RMFError(BaseError):
     RMFライブラリの一般的なエラークラス。
     特定のエラーカテゴリに分類できないRMF固有のエラーに使用します。
     """
+    __slots__ = ()
     error_code = 'RMF'
 
 
@@ -68,6 +95,7 @@ class TimeoutError(RMFError):
     ネットワーク操作のタイムアウトを示します。
     主にHTTPリクエストが指定時間内に完了しなかった場合に発生します。
     """
+    __slots__ = ()
     error_code = 'TIMEOUT'
 
 
@@ -77,6 +105,7 @@ class ConnectionError(RMFError):
     ネットワーク接続に関するエラーを示します。
     主にホストへの接続が確立できない場合に発生します。
     """
+    __slots__ = ()
     error_code = 'CONNECTION'
 
 
@@ -86,6 +115,7 @@ class ConfigError(BaseError):
     設定の読み込みや解析中に発生するエラーを示します。
     設定ファイルの形式不正や必須パラメータの欠落時に使用します。
     """
+    __slots__ = ()
     error_code = 'CFG'
 
 
@@ -95,6 +125,7 @@ class NetworkError(BaseError):
     ネットワーク通信中に発生するエラーを示します。
     タイムアウトや接続エラー以外のネットワーク関連エラーに使用します。
     """
+    __slots__ = ()
     error_code = 'NET'
 
 
@@ -104,6 +135,7 @@ class ToolError(RMFError):
     リモートツールの呼び出し中に発生するエラーを示します。
     主にツールが見つからない場合や実行に失敗した場合に発生します。
     """
+    __slots__ = ()
     error_code = 'TOOL'
 
 
@@ -113,9 +145,18 @@ class SSEError(BaseError):
     SSE（Server-Sent Events）処理中に発生するエラーを示します。
     イベントストリームの処理に問題がある場合に使用します。
     """
+    __slots__ = ()
     error_code = 'SSE'
 
 
+# リトライを推奨するエラー型
+# ネットワークエラーは基本的にリトライし、接続・タイムアウトも一時的なエラーとして扱う
+_RETRY_TYPES = (NetworkError, ConnectionError, TimeoutError)
+
+# 例外クラス -> リトライ推奨かどうか（初回の判定時に記録）
+_RETRYABLE_CLASSES: Dict[type, bool] = {}
+
+
 class ErrorHandler:
     """エラーハンドリング統一クラス
     
@@ -144,6 +185,11 @@ class ErrorHandler:
             BaseError: self._handle_base_error,
             Exception: self._handle_generic_error
         }
+        
+        # 例外クラス -> 対応するhandlersのキー（初回のhandle時に解決して記録）
+        self._dispatch_cache: Dict[type, type] = {}
+        self._cached_handlers = None
+        self._cached_handler_count = 0
     
     def handle(self, error: Exception, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """エラー処理の統一メソッド
@@ -156,40 +202,93 @@ class ErrorHandler:
             処理結果の辞書
         """
         context = context or {}
-        
-        # エラータイプに対応するハンドラを検索
-        for error_type, handler in self.handlers.items():
-            if isinstance(error, error_type):
-                return handler(error, context)
-        
-        # 該当するハンドラがない場合は汎用ハンドラを使用
-        return self._handle_generic_error(error, context)
+        handlers = self.handlers
+        cache = self._dispatch_cache
+        
+        # handlersが差し替えられたり型が追加・削除された場合は解決結果を破棄
+        if handlers is not self._cached_handlers or len(handlers) != self._cached_handler_count:
+            cache.clear()
+            self._cached_handlers = handlers
+            self._cached_handler_count = len(handlers)
+        
+        # 解決済みの例外クラスは辞書の参照だけでハンドラを取得
+        error_class = type(error)
+        error_type = cache.get(error_class)
+        handler = handlers.get(error_type) if error_type is not None else None
+        
+        if handler is None:
+            # 例外クラスのMROを辿り、最も近いクラスのハンドラを使用
+            for error_type in error_class.__mro__:
+                handler = handlers.get(error_type)
+                if handler is not None:
+                    cache[error_class] = error_type
+                    break
+            else:
+                # 該当するハンドラがない場合は汎用ハンドラを使用
+                return self._handle_generic_error(error, context)
+        
+        return handler(error, context)
     
-    def _handle_config_error(self, error: ConfigError, context: Dict[str, Any]) -> Dict[str, Any]:
-        """設定エラー処理
+    def _handle_error(self, label: str, error_type: str, error: BaseError, context: Dict[str, Any],
+                      extra: Optional[Dict[str, Any]] = None, retry: bool = False) -> Dict[str, Any]:
+        """RMFエラー共通の処理
         
         Args:
-            error: 設定エラーオブジェクト
+            label: ログメッセージの見出し
+            error_type: ログに記録するエラー種別
+            error: エラーオブジェクト
             context: エラーコンテキスト
+            extra: エラー種別固有の詳細情報
+            retry: 結果にリトライ推奨フラグを含める場合True
             
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': 'ConfigError',
-            'error_code': error.error_code,
-            **error.details,
-            **context
-        }
+        # ERRORログが出力されない場合は詳細情報を組み立てない
+        if self.logger.isEnabledFor(logging.ERROR):
+            details = {'error_type': error_type, 'error_code': error.error_code}
+            if extra:
+                details.update(extra)
+            details.update(error.details)
+            details.update(context)
+            
+            self.logger.error("%s: %s", label, error.message, details=details)
         
-        self.logger.error(f"設定エラー: {error.message}", details=details)
+        return self._build_result(error, context, retry)
+    
+    def _build_result(self, error: BaseError, context: Dict[str, Any], retry: bool = False) -> Dict[str, Any]:
+        """処理結果の辞書を作成
         
-        return {
+        Args:
+            error: エラーオブジェクト
+            context: エラーコンテキスト
+            retry: リトライ推奨フラグを含める場合True
+            
+        Returns:
+            処理結果の辞書
+        """
+        result = {
             'success': False,
             'error': str(error),
             'error_code': error.error_code,
             'details': error.details
         }
+        if retry:
+            # リトライ情報を含めて返す
+            result['retry_recommended'] = self._should_retry(error, context)
+        return result
+    
+    def _handle_config_error(self, error: ConfigError, context: Dict[str, Any]) -> Dict[str, Any]:
+        """設定エラー処理
+        
+        Args:
+            error: 設定エラーオブジェクト
+            context: エラーコンテキスト
+            
+        Returns:
+            処理結果の辞書
+        """
+        return self._handle_error('設定エラー', 'ConfigError', error, context)
     
     def _handle_network_error(self, error: NetworkError, context: Dict[str, Any]) -> Dict[str, Any]:
         """ネットワークエラー処理
@@ -201,24 +300,10 @@ class ErrorHandler:
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': 'NetworkError',
-            'error_code': error.error_code,
-            'retry_count': context.get('retry_count', 0),
-            **error.details,
-            **context
-        }
-        
-        self.logger.error(f"ネットワークエラー: {error.message}", details=details)
-        
-        # リトライ情報を含めて返す
-        return {
-            'success': False,
-            'error': str(error),
-            'error_code': error.error_code,
-            'details': error.details,
-            'retry_recommended': self._should_retry(error, context)
-        }
+        return self._handle_error(
+            'ネットワークエラー', 'NetworkError', error, context,
+            {'retry_count': context.get('retry_count', 0)}, retry=True
+        )
     
     def _handle_tool_error(self, error: ToolError, context: Dict[str, Any]) -> Dict[str, Any]:
         """ツールエラー処理
@@ -230,22 +315,10 @@ class ErrorHandler:
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': 'ToolError',
-            'error_code': error.error_code,
-            'tool_name': context.get('tool_name', 'unknown'),
-            **error.details,
-            **context
-        }
-        
-        self.logger.error(f"ツールエラー: {error.message}", details=details)
-        
-        return {
-            'success': False,
-            'error': str(error),
-            'error_code': error.error_code,
-            'details': error.details
-        }
+        return self._handle_error(
+            'ツールエラー', 'ToolError', error, context,
+            {'tool_name': context.get('tool_name', 'unknown')}
+        )
     
     def _handle_sse_error(self, error: SSEError, context: Dict[str, Any]) -> Dict[str, Any]:
         """SSEエラー処理
@@ -257,21 +330,7 @@ class ErrorHandler:
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': 'SSEError',
-            'error_code': error.error_code,
-            **error.details,
-            **context
-        }
-        
-        self.logger.error(f"SSEエラー: {error.message}", details=details)
-        
-        return {
-            'success': False,
-            'error': str(error),
-            'error_code': error.error_code,
-            'details': error.details
-        }
+        return self._handle_error('SSEエラー', 'SSEError', error, context)
     
     def _handle_timeout_error(self, error: TimeoutError, context: Dict[str, Any]) -> Dict[str, Any]:
         """タイムアウトエラー処理
@@ -283,23 +342,10 @@ class ErrorHandler:
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': 'TimeoutError',
-            'error_code': error.error_code,
-            'timeout': context.get('timeout', 'unknown'),
-            **error.details,
-            **context
-        }
-        
-        self.logger.error(f"タイムアウトエラー: {error.message}", details=details)
-        
-        return {
-            'success': False,
-            'error': str(error),
-            'error_code': error.error_code,
-            'details': error.details,
-            'retry_recommended': self._should_retry(error, context)
-        }
+        return self._handle_error(
+            'タイムアウトエラー', 'TimeoutError', error, context,
+            {'timeout': context.get('timeout', 'unknown')}, retry=True
+        )
     
     def _handle_connection_error(self, error: ConnectionError, context: Dict[str, Any]) -> Dict[str, Any]:
         """接続エラー処理
@@ -311,23 +357,10 @@ class ErrorHandler:
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': 'ConnectionError',
-            'error_code': error.error_code,
-            'host': context.get('host', 'unknown'),
-            **error.details,
-            **context
-        }
-        
-        self.logger.error(f"接続エラー: {error.message}", details=details)
-        
-        return {
-            'success': False,
-            'error': str(error),
-            'error_code': error.error_code,
-            'details': error.details,
-            'retry_recommended': self._should_retry(error, context)
-        }
+        return self._handle_error(
+            '接続エラー', 'ConnectionError', error, context,
+            {'host': context.get('host', 'unknown')}, retry=True
+        )
     
     def _handle_rmf_error(self, error: RMFError, context: Dict[str, Any]) -> Dict[str, Any]:
         """RMF一般エラー処理
@@ -339,21 +372,7 @@ class ErrorHandler:
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': 'RMFError',
-            'error_code': error.error_code,
-            **error.details,
-            **context
-        }
-        
-        self.logger.error(f"RMFエラー: {error.message}", details=details)
-        
-        return {
-            'success': False,
-            'error': str(error),
-            'error_code': error.error_code,
-            'details': error.details
-        }
+        return self._handle_error('RMFエラー', 'RMFError', error, context)
     
     def _handle_base_error(self, error: BaseError, context: Dict[str, Any]) -> Dict[str, Any]:
         """基本エラー処理
@@ -365,21 +384,7 @@ class ErrorHandler:
         Returns:
             処理結果の辞書
         """
-        details = {
-            'error_type': error.__class__.__name__,
-            'error_code': error.error_code,
-            **error.details,
-            **context
-        }
-        
-        self.logger.error(f"基本エラー: {error.message}", details=details)
-        
-        return {
-            'success': False,
-            'error': str(error),
-            'error_code': error.error_code,
-            'details': error.details
-        }
+        return self._handle_error('基本エラー', error.error_type_name, error, context)
     
     def _handle_generic_error(self, error: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
         """汎用エラー処理
@@ -397,7 +402,7 @@ class ErrorHandler:
             **context
         }
         
-        self.logger.error(f"予期しないエラー: {str(error)}", details=error_info)
+        self.logger.error("予期しないエラー: %s", error, details=error_info)
         
         return {
             'success': False,
@@ -423,15 +428,12 @@ class ErrorHandler:
         if retry_count >= max_retries:
             return False
         
-        # ネットワークエラーは基本的にリトライ
-        if isinstance(error, NetworkError):
-            return True
-        
-        # 一時的なエラーとして扱えるものはリトライ
-        if isinstance(error, (ConnectionError, TimeoutError)):
-            return True
-        
-        return False
+        # 例外クラスごとの判定結果を再利用する
+        error_class = type(error)
+        retryable = _RETRYABLE_CLASSES.get(error_class)
+        if retryable is None:
+            retryable = _RETRYABLE_CLASSES[error_class] = issubclass(error_class, _RETRY_TYPES)
+        return retryable
 
 
 def create_error_handler(logger: StructuredLogger) -> ErrorHandler:
@@ -8,19 +8,112 @@ import logging
 import json
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 import os
+import queue
 import sys
+import threading
 import time
+from contextvars import ContextVar
 from pathlib import Path
 from .platform import PlatformUtils
 
+# orjsonが利用可能な場合はC実装でJSON変換を行う
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjsonは任意の依存関係
+    orjson = None
+
+
+def _dumps_bytes(data: Dict[str, Any]) -> bytes:
+    """辞書をUTF-8のJSONバイト列に変換
+    
+    orjsonが利用可能な場合はそちらを使用し、なければ標準のjsonを使用します。
+    どちらの場合も非ASCII文字はエスケープしません。
+    
+    Args:
+        data: 変換する辞書
+    
+    Returns:
+        bytes: UTF-8でエンコードされたJSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """辞書をJSON文字列に変換
+    
+    Args:
+        data: 変換する辞書
+    
+    Returns:
+        str: JSON文字列
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False)
+
 
 class JSONFormatter(logging.Formatter):
     """JSON形式のログフォーマッタ"""
     
+    def __init__(self, *args, **kwargs):
+        """初期化
+        
+        Args:
+            *args: logging.Formatterのパラメータ
+            **kwargs: logging.Formatterのキーワードパラメータ
+        """
+        super().__init__(*args, **kwargs)
+        # 秒単位の時刻文字列のキャッシュ（秒, 文字列）
+        self._time_cache = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """ログレコードの時刻を文字列に変換
+        
+        デフォルトの書式では、同じ秒のレコードに対してstrftimeを再実行せず、
+        キャッシュした文字列にミリ秒を付加します。
+        """
+        if datefmt is not None or self.datefmt is not None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+    
     def format(self, record: logging.LogRecord) -> str:
         """ログレコードをJSON形式に変換"""
+        return self._encode(record, _dumps)
+    
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """ログレコードをUTF-8のJSONバイト列に変換
+        
+        バイナリモードのストリームに書き込む際に、文字列への
+        デコードと再エンコードを省くために使用します。
+        """
+        return self._encode(record, _dumps_bytes)
+    
+    def _encode(self, record: logging.LogRecord, dumps: Callable[[Dict[str, Any]], Any]) -> Any:
+        """ログレコードを指定の関数でJSONに変換
+        
+        Args:
+            record: ログレコード
+            dumps: 辞書をJSONに変換する関数
+        
+        Returns:
+            変換結果（dumpsの戻り値）
+        """
+        # detailsの取得（record.detailsがなければrecord.extra['details']を参照）
+        details = getattr(record, 'details', None)
+        if details is None:
+            extra = getattr(record, 'extra', None)
+            details = extra.get('details') if isinstance(extra, dict) else None
+        
         # 基本的なログデータを構築
         log_data = {
             'timestamp': self.formatTime(record),
@@ -29,21 +122,11 @@ class JSONFormatter(logging.Formatter):
             'module': record.module,
             'function': record.funcName,
             'line': record.lineno,
-            'details': {}  # デフォルトで空の辞書を設定
+            'details': details if isinstance(details, dict) else {}  # デフォルトで空の辞書を設定
         }
         
-        # detailsの取得と処理
-        if hasattr(record, 'details'):
-            if isinstance(record.details, dict):
-                log_data['details'] = record.details
-        elif hasattr(record, 'extra'):
-            if isinstance(record.extra, dict) and 'details' in record.extra:
-                details = record.extra.get('details', {})
-                if isinstance(details, dict):
-                    log_data['details'] = details
-        
-        # エラー情報の追加
-        if record.exc_info:
+        # エラー情報の追加（例外の処理中以外でexc_info=Trueとした場合は(None, None, None)になる）
+        if record.exc_info and record.exc_info[0] is not None:
             log_data['error'] = {
                 'type': record.exc_info[0].__name__,
                 'message': str(record.exc_info[1]),
@@ -51,7 +134,7 @@ class JSONFormatter(logging.Formatter):
             }
         
         try:
-            return json.dumps(log_data, ensure_ascii=False)
+            return dumps(log_data)
         except Exception as e:
             # JSON変換に失敗した場合のフォールバック
             fallback_data = {
@@ -62,7 +145,14 @@ class JSONFormatter(logging.Formatter):
                 'original_message': record.getMessage(),
                 'details': {}
             }
-            return json.dumps(fallback_data, ensure_ascii=False)
+            return dumps(fallback_data)
+
+
+# 書き込みスレッドが一度に書き込むレコード数の上限
+_WRITE_BATCH_SIZE = 256
+
+# 書き込みスレッドの停止を指示する番兵
+_STOP_WRITER = object()
 
 
 class SafeRotatingFileHandler(RotatingFileHandler):
@@ -71,11 +161,23 @@ class SafeRotatingFileHandler(RotatingFileHandler):
     特にWindows環境でのファイルロック問題に対応します。
     """
     
-    def __init__(self, filename, **kwargs):
+    def __init__(self, filename, queue_size: int = 10000, buffer_size: int = 1 << 16,
+                 flush_interval_s: float = 0.2,
+                 fsync_interval_records: int = 64, fsync_interval_s: float = 1.0, **kwargs):
         """初期化
         
+        バックグラウンド書き込みでは、レコードはbuffer_sizeのバッファに溜め、
+        キューが空になった時点か、flush_interval_sごとにフラッシュします。
+        同期書き込みでは毎回フラッシュします。fsyncはフラッシュ時に
+        fsync_interval_records件またはfsync_interval_s秒ごとに行います。
+        
         Args:
             filename: ログファイルのパス
+            queue_size: 書き込み待ちレコードの上限（0の場合は同期的に書き込む）
+            buffer_size: ファイルの書き込みバッファのサイズ（バイト）
+            flush_interval_s: バックグラウンド書き込みでフラッシュを行う最大間隔（秒）
+            fsync_interval_records: Windows環境でfsyncを行うレコード数の間隔（1の場合は毎回）
+            fsync_interval_s: Windows環境でfsyncを行う時間の間隔（秒）
             **kwargs: RotatingFileHandlerの追加パラメータ
         """
         # ファイルパスを正規化
@@ -87,66 +189,293 @@ class SafeRotatingFileHandler(RotatingFileHandler):
         # Windows環境での問題を回避するため、mode='a'を明示的に指定
         kwargs['mode'] = kwargs.get('mode', 'a')
         kwargs['encoding'] = kwargs.get('encoding', 'utf-8')
-        kwargs['delay'] = False  # 常に即時オープン
+        # ファイルは最初のログレコード出力時に開く
+        kwargs['delay'] = kwargs.get('delay', True)
+        
+        # delay=Falseの場合は親クラスの初期化中に_open()が呼ばれるため、先に設定する
+        self._buffer_size = buffer_size
         
         super().__init__(filename, **kwargs)
         
         # Windows環境でのファイルロックを確実に解放するため
         self.terminator = '\n'
+        
+        # ファイルはバイナリモードで開き、エンコード済みのバイト列を書き込む
+        self._encoding = self.encoding or 'utf-8'
+        self._terminator_bytes = self.terminator.encode(self._encoding)
+        
+        # ストリームへの書き込みを保護するロック
+        # 書き込みスレッドとも共有するため、ハンドラのロックとは別に持つ
+        self._write_lock = threading.Lock()
+        
+        # fsyncが必要かどうかはプロセス中で変わらないため一度だけ判定
+        self._needs_fsync = PlatformUtils.is_windows() and hasattr(os, 'fsync')
+        
+        # fsyncの間隔（レコード数または経過時間のどちらかに達したら実行）
+        self._fsync_interval_records = fsync_interval_records
+        self._fsync_interval_s = fsync_interval_s
+        self._records_since_fsync = 0
+        self._last_fsync = time.monotonic()
+        
+        # フラッシュの間隔
+        self._flush_interval_s = flush_interval_s
+        self._last_flush = time.monotonic()
+        
+        # ローテーション判定用のファイルサイズ（_sized_streamに対する書き込み済みバイト数）
+        # レコードごとにtell()を呼ばず、ストリームを開いた時点のサイズに書き込んだ長さを加算する
+        self._stream_size = 0
+        self._sized_stream = None
+        
+        # バックグラウンド書き込み用のキュー（スレッドは最初の出力時に開始）
+        self._queue = queue.Queue(maxsize=queue_size) if queue_size > 0 else None
+        self._writer = None
     
     def emit(self, record):
         """ログレコードの出力
         
+        フォーマットは呼び出し元のスレッドで行い、ファイルへの書き込みは
+        バックグラウンドスレッドにまとめて任せます。キューが満杯の場合は
+        同期的に書き込みます。
+        
         Args:
             record: ログレコード
         """
         try:
+            # レコードをバイト列にフォーマット
+            item = (record, self._format_bytes(record))
+            
+            if self._queue is not None:
+                self._start_writer()
+                try:
+                    self._queue.put_nowait(item)
+                    return
+                except queue.Full:
+                    pass
+            
+            self._write_batch([item])
+            
+        except Exception:
+            self.handleError(record)
+    
+    def _format_bytes(self, record) -> bytes:
+        """ログレコードを改行付きのバイト列に変換
+        
+        フォーマッタがformat_bytes()を持つ場合は、文字列を経由せずに変換します。
+        
+        Args:
+            record: ログレコード
+        
+        Returns:
+            bytes: ファイルに書き込むバイト列
+        """
+        format_bytes = getattr(self.formatter, 'format_bytes', None)
+        if format_bytes is not None:
+            return format_bytes(record) + self._terminator_bytes
+        return (self.format(record) + self.terminator).encode(self._encoding)
+    
+    def _open(self):
+        """ログファイルをバイナリモードで開く
+        
+        フォーマット済みのバイト列をそのまま書き込むため、
+        テキストモードのエンコード処理を経由しません。
+        ディレクトリの存在確認は初期化時に済ませているため、ここでは行いません。
+        """
+        mode = self.mode if 'b' in self.mode else self.mode + 'b'
+        try:
+            return open(self.baseFilename, mode, buffering=self._buffer_size)
+        except FileNotFoundError:
+            # 初期化後にディレクトリが削除された場合のみ作成し直す
+            PlatformUtils.ensure_directory(Path(self.baseFilename).parent)
+            return open(self.baseFilename, mode, buffering=self._buffer_size)
+    
+    def _start_writer(self):
+        """書き込みスレッドを開始（未開始の場合のみ）"""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._run_writer,
+                name='rmf-log-writer',
+                daemon=True
+            )
+            self._writer.start()
+    
+    def _run_writer(self):
+        """書き込みスレッドの処理
+        
+        キューからレコードを最大_WRITE_BATCH_SIZE件ずつ取り出して書き込みます。
+        フラッシュはキューが空になった時点か、一定間隔ごとに行います。
+        """
+        log_queue = self._queue
+        unflushed = False
+        while True:
+            try:
+                if unflushed:
+                    item = log_queue.get(timeout=self._flush_interval_s)
+                else:
+                    item = log_queue.get()
+            except queue.Empty:
+                # 新しいレコードがなければバッファの内容を書き出す
+                self._flush_buffer()
+                unflushed = False
+                continue
+            
+            batch = []
+            taken = 1
+            stop = False
+            
+            # 待機中のレコードをまとめて取り出す
+            while True:
+                if item is _STOP_WRITER:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= _WRITE_BATCH_SIZE:
+                    break
+                try:
+                    item = log_queue.get_nowait()
+                    taken += 1
+                except queue.Empty:
+                    break
+            
+            try:
+                if batch:
+                    # 書き込みが続く場合も一定間隔ごとにフラッシュする
+                    flush = time.monotonic() - self._last_flush >= self._flush_interval_s
+                    self._write_batch(batch, flush=flush)
+                    unflushed = not flush
+            finally:
+                for _ in range(taken):
+                    log_queue.task_done()
+            
+            if stop:
+                return
+    
+    def _write_batch(self, batch, flush: bool = True):
+        """フォーマット済みレコードをまとめて書き込む
+        
+        ローテーションの判定もストリームと同じロックの中で行い、
+        書き込むとmaxBytesに達する場合は書き込む前にローテーションします。
+        
+        Args:
+            batch: (ログレコード, 出力バイト列) のリスト
+            flush: 書き込み後にフラッシュする場合True
+        """
+        with self._write_lock:
             # ストリームが存在しない場合は開く
             if self.stream is None:
                 self.stream = self._open()
-            
-            # レコードをフォーマット
-            msg = self.format(record)
             stream = self.stream
             
-            try:
-                # エンコーディングに応じた書き込み
-                if getattr(stream, 'encoding', None) is not None:
-                    stream.write(msg + self.terminator)
-                else:
-                    stream.write(bytes(msg + self.terminator, 'utf-8'))
-                
-                # 即時フラッシュしてディスクに書き込む
-                self.flush()
-                
-                # Windows環境では確実に書き込まれるよう追加措置
-                if PlatformUtils.is_windows() and hasattr(os, 'fsync') and hasattr(stream, 'fileno'):
-                    try:
-                        os.fsync(stream.fileno())
-                    except Exception:
-                        pass
-                
-            except Exception:
-                self.handleError(record)
+            # テキストモードのストリームが設定されている場合のみデコードする
+            text_mode = getattr(stream, 'encoding', None) is not None
+            max_bytes = self.maxBytes
+            size = self._current_size(stream) if max_bytes > 0 else 0
+            for record, msg in batch:
+                try:
+                    # 空のファイルはローテーションしない（1件でmaxBytesを超える場合）
+                    if max_bytes > 0 and size and size + len(msg) >= max_bytes:
+                        # delay=Falseの場合はdoRollover()がファイルを開き直す
+                        self.doRollover()
+                        if self.stream is None:
+                            self.stream = self._open()
+                        stream = self.stream
+                        size = self._current_size(stream)
+                    stream.write(msg.decode(self._encoding) if text_mode else msg)
+                    size += len(msg)
+                except Exception:
+                    self.handleError(record)
+            self._stream_size = size
+            self._records_since_fsync += len(batch)
             
-        except Exception:
-            self.handleError(record)
+            if flush:
+                try:
+                    self._flush_stream()
+                except Exception:
+                    self.handleError(batch[-1][0])
     
-    def close(self):
-        """ファイルハンドラのクローズ処理"""
-        if self.stream:
+    def _current_size(self, stream) -> int:
+        """ストリームの現在のサイズ（バイト）を取得
+        
+        tell()はストリームが開き直された場合のみ呼び出し、それ以外は
+        書き込んだバイト数から求めた値を返します。_write_lockを取得した状態で呼び出します。
+        
+        Args:
+            stream: 書き込み先のストリーム
+        
+        Returns:
+            int: ファイルのサイズ
+        """
+        if stream is not self._sized_stream:
+            self._sized_stream = stream
+            self._stream_size = stream.tell()
+        return self._stream_size
+    
+    def _flush_buffer(self):
+        """書き込みバッファの内容をファイルに書き出す（書き込みスレッド用）"""
+        with self._write_lock:
             try:
-                self.flush()
-                if hasattr(self.stream, 'fileno'):
-                    try:
-                        os.fsync(self.stream.fileno())
-                    except Exception:
-                        pass
-                self.stream.close()
+                self._flush_stream()
             except Exception:
                 pass
-            finally:
-                self.stream = None
+    
+    def _flush_stream(self):
+        """ストリームをフラッシュし、必要に応じてfsyncする
+        
+        _write_lockを取得した状態で呼び出します。
+        """
+        stream = self.stream
+        if stream is None:
+            return
+        
+        stream.flush()
+        self._last_flush = time.monotonic()
+        
+        # Windows環境では一定間隔でディスクへの書き込みを確定させる
+        if self._needs_fsync and self._records_since_fsync:
+            if (self._records_since_fsync >= self._fsync_interval_records
+                    or self._last_flush - self._last_fsync >= self._fsync_interval_s):
+                self._records_since_fsync = 0
+                self._last_fsync = self._last_flush
+                try:
+                    os.fsync(stream.fileno())
+                except Exception:
+                    pass
+    
+    def flush(self):
+        """書き込み待ちのレコードを出力してストリームをフラッシュ"""
+        writer = self._writer
+        if writer is not None and writer.is_alive() and writer is not threading.current_thread():
+            self._queue.join()
+        
+        with self._write_lock:
+            if self.stream and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+    
+    def _stop_writer(self):
+        """書き込み待ちのレコードを出力して書き込みスレッドを停止"""
+        writer = self._writer
+        if writer is not None and writer.is_alive() and writer is not threading.current_thread():
+            self._queue.put(_STOP_WRITER)
+            writer.join()
+        self._writer = None
+    
+    def close(self):
+        """ファイルハンドラのクローズ処理"""
+        self._stop_writer()
+        
+        with self._write_lock:
+            if self.stream:
+                try:
+                    self.stream.flush()
+                    if hasattr(self.stream, 'fileno'):
+                        try:
+                            os.fsync(self.stream.fileno())
+                        except Exception:
+                            pass
+                    self.stream.close()
+                except Exception:
+                    pass
+                finally:
+                    self.stream = None
 
 
 class LoggingManager:
@@ -181,15 +510,10 @@ class LoggingManager:
             logger.removeHandler(handler)
         
         try:
-            # ログファイルのパスを正規化
-            log_file = Path(config['file']).resolve()
-            
-            # ディレクトリが存在しない場合は作成
-            PlatformUtils.ensure_directory(log_file.parent)
-            
             # ファイルハンドラの設定
+            # パスの正規化とディレクトリの作成はハンドラの初期化時に一度だけ行う
             file_handler = SafeRotatingFileHandler(
-                str(log_file),
+                str(config['file']),
                 maxBytes=10 * 1024 * 1024,  # 10MB
                 backupCount=5
             )
@@ -210,16 +534,23 @@ class LoggingManager:
             console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
             logger.addHandler(console_handler)
             
-            logger.error(f"ロギング設定エラー: {str(e)}", exc_info=True)
+            logger.error("ロギング設定エラー: %s", e, exc_info=True)
             return logger
 
 
+# LogContextで追加されたコンテキスト情報
+# スレッドやasyncioタスクごとに独立し、辞書自体は変更せずに置き換える
+_LOG_CONTEXT: ContextVar[Dict[str, Any]] = ContextVar('rmf_log_context', default={})
+
+
 class StructuredLogger:
     """構造化ロギング用クラス
     
     詳細情報（details）付きのログを出力します。
     """
     
+    __slots__ = ('logger', 'context')
+    
     def __init__(self, logger, context=None):
         """初期化
         
@@ -230,6 +561,17 @@ class StructuredLogger:
         self.logger = logger
         self.context = context or {}
     
+    def isEnabledFor(self, level):
+        """指定レベルのログが出力されるかを判定
+        
+        Args:
+            level: ログレベル
+        
+        Returns:
+            出力される場合True
+        """
+        return self.logger.isEnabledFor(level)
+    
     def _prepare_extras(self, details=None, **kwargs):
         """extra情報の準備
         
@@ -240,61 +582,81 @@ class StructuredLogger:
         Returns:
             準備されたextra情報
         """
-        combined_details = self.context.copy()
-        if details:
-            combined_details.update(details)
+        # ロガーのコンテキストにLogContextの情報を重ねる
+        context = self.context
+        overlay = _LOG_CONTEXT.get()
+        if overlay:
+            context = {**context, **overlay} if context else overlay
+        
+        # コンテキストがない場合はdetailsをコピーせずにそのまま渡す
+        if not context:
+            combined_details = details if details else {}
+        elif details:
+            combined_details = {**context, **details}
+        else:
+            combined_details = dict(context)
         
         # 既にextraが存在する場合は、それを更新
-        if 'extra' not in kwargs:
-            kwargs['extra'] = {}
-        
         # RecordFactory方式ではなく、extra経由でdetailsを渡す
-        kwargs['extra']['details'] = combined_details
+        kwargs.setdefault('extra', {})['details'] = combined_details
         
         return kwargs
     
-    def debug(self, message, details=None, **kwargs):
+    def debug(self, message, *args, details=None, **kwargs):
         """DEBUGログの出力
         
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を使用可能）
+            *args: メッセージの書式に埋め込む値（出力時にのみ展開）
             details: 詳細情報
             **kwargs: その他のパラメータ
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         kwargs = self._prepare_extras(details, **kwargs)
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
     
-    def info(self, message, details=None, **kwargs):
+    def info(self, message, *args, details=None, **kwargs):
         """INFOログの出力
         
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を使用可能）
+            *args: メッセージの書式に埋め込む値（出力時にのみ展開）
             details: 詳細情報
             **kwargs: その他のパラメータ
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         kwargs = self._prepare_extras(details, **kwargs)
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message, details=None, **kwargs):
+    def warning(self, message, *args, details=None, **kwargs):
         """WARNINGログの出力
         
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を使用可能）
+            *args: メッセージの書式に埋め込む値（出力時にのみ展開）
             details: 詳細情報
             **kwargs: その他のパラメータ
         """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         kwargs = self._prepare_extras(details, **kwargs)
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message, error=None, details=None, **kwargs):
+    def error(self, message, *args, error=None, details=None, **kwargs):
         """ERRORログの出力
         
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を使用可能）
+            *args: メッセージの書式に埋め込む値（出力時にのみ展開）
             error: 例外オブジェクト
             details: 詳細情報
             **kwargs: その他のパラメータ
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         # エラー情報を詳細に追加
         error_details = details or {}
         if error:
@@ -304,17 +666,21 @@ class StructuredLogger:
             })
         
         kwargs = self._prepare_extras(error_details, **kwargs)
-        self.logger.error(message, exc_info=error is not None, **kwargs)
+        self.logger.error(message, *args, exc_info=error is not None, **kwargs)
     
-    def critical(self, message, error=None, details=None, **kwargs):
+    def critical(self, message, *args, error=None, details=None, **kwargs):
         """CRITICALログの出力
         
         Args:
-            message: ログメッセージ
+            message: ログメッセージ（%形式の書式を使用可能）
+            *args: メッセージの書式に埋め込む値（出力時にのみ展開）
             error: 例外オブジェクト
             details: 詳細情報
             **kwargs: その他のパラメータ
         """
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
+        
         # エラー情報を詳細に追加
         error_details = details or {}
         if error:
@@ -324,7 +690,7 @@ class StructuredLogger:
             })
         
         kwargs = self._prepare_extras(error_details, **kwargs)
-        self.logger.critical(message, exc_info=error is not None, **kwargs)
+        self.logger.critical(message, *args, exc_info=error is not None, **kwargs)
 
 
 class LogContext:
@@ -333,6 +699,8 @@ class LogContext:
     with文で使用し、ログに一時的なコンテキスト情報を追加します。
     """
     
+    __slots__ = ('context', '_token')
+    
     def __init__(self, test_name=None, function_name=None, **kwargs):
         """初期化
         
@@ -346,45 +714,16 @@ class LogContext:
             self.context['function_name'] = function_name
         self.context.update(kwargs)
         
-        # 元のロギングコンテキストを保存するため変数
-        self._original_context = None
-        self._previous_loggers = {}
+        # __exit__で元に戻すためのトークン
+        self._token = None
     
     def __enter__(self):
         """コンテキスト開始処理
         
-        現在のスレッドに関連するすべてのロガーのコンテキストを一時的に変更します
+        現在の実行コンテキスト（スレッド・asyncioタスク）のログに
+        コンテキスト情報を追加します
         """
-        # rmfロガーと関連ロガーを取得
-        loggers = [logging.getLogger('rmf')]
-        loggers.extend([logging.getLogger(name) for name in logging.root.manager.loggerDict if name.startswith('rmf.')])
-        
-        # 元のコンテキストを保存して新しいコンテキストを設定
-        for logger in loggers:
-            if hasattr(logger, 'context'):
-                structured_logger = logger
-            else:
-                # 通常のロガーからStructuredLoggerを取得できるか試みる
-                structured_logger = None
-                for handler in logger.handlers:
-                    if hasattr(handler, 'logger') and isinstance(handler.logger, StructuredLogger):
-                        structured_logger = handler.logger
-                        break
-            
-            if structured_logger:
-                self._previous_loggers[logger.name] = structured_logger
-                
-                # 元のコンテキストを保存
-                original_context = structured_logger.context.copy()
-                
-                # 新しいコンテキストを設定
-                structured_logger.context.update(self.context)
-                
-                # 元に戻すために保存
-                if not self._original_context:
-                    self._original_context = {}
-                self._original_context[logger.name] = original_context
-        
+        self._token = _LOG_CONTEXT.set({**_LOG_CONTEXT.get(), **self.context})
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -392,11 +731,8 @@ class LogContext:
         
         変更したコンテキストを元に戻します
         """
-        if self._original_context:
-            for logger_name, original_context in self._original_context.items():
-                if logger_name in self._previous_loggers:
-                    # コンテキストを元に戻す
-                    self._previous_loggers[logger_name].context = original_context
+        _LOG_CONTEXT.reset(self._token)
+        self._token = None
         
         return False  # 例外を再スローする
 
@@ -4,14 +4,107 @@
 """
 
 import asyncio
+import copy
+import functools
+import importlib.util
+import json
+import logging
+import random
+import time
 import aiohttp
-import backoff
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from .errors import RMFError, ConfigError, TimeoutError, ConnectionError, ToolError
 from .logging import get_logger, LogContext, setup_logging
 
+# orjsonが利用可能な場合はC実装でJSONの変換を行う
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjsonは任意の依存関係
+    orjson = None
+
 logger = get_logger(__name__)
 
+# レスポンス本文の解析に使用する関数
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# 1行ごとに解析して返すレスポンスのContent-Type（JSON Lines・JSON Text Sequences）
+_NDJSON_CONTENT_TYPES = frozenset({"application/x-ndjson", "application/jsonl", "application/json-seq"})
+
+# JSON Text Sequences（RFC 7464）の各レコードの先頭に付くレコード区切り文字（RS）
+_JSON_SEQ_CONTENT_TYPE = "application/json-seq"
+_RECORD_SEPARATOR = b"\x1e"
+
+# ストリーミング受信時に一度に読み込むバイト数
+_STREAM_CHUNK_SIZE = 16384
+
+
+def _json_dumps_bytes(data: Dict[str, Any]) -> bytes:
+    """リクエスト本文用に辞書をUTF-8のJSONバイト列に変換
+    
+    Args:
+        data: 変換する辞書
+    
+    Returns:
+        bytes: UTF-8でエンコードされたJSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _canonical_json(data: Dict[str, Any]) -> bytes:
+    """キーの順序に依存しないJSONバイト列に変換
+
+    Args:
+        data: 変換する辞書
+
+    Returns:
+        bytes: キーを並べ替えたJSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
+def _retry_on(*exceptions):
+    """指定した例外の発生時にリトライするデコレータ
+
+    リトライ回数と待機時間はインスタンスの config["retry"] に従います。
+    待機時間はdecorrelated jitterで決め、複数のクライアントが同時に
+    リトライしてリモートMCPへ負荷が集中するのを避けます。
+
+    Args:
+        exceptions: リトライ対象の例外クラス
+
+    Returns:
+        デコレータ
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            retry = self.config["retry"]
+            max_attempts = retry["max_attempts"]
+            initial_delay = retry["initial_delay"]
+            delay = initial_delay
+            attempt = 1
+            while True:
+                try:
+                    return await func(self, *args, **kwargs)
+                except exceptions as e:
+                    if attempt >= max_attempts:
+                        raise
+                    # 前回の待機時間の3倍までの範囲から無作為に選ぶ
+                    delay = min(retry["max_delay"], random.uniform(initial_delay, delay * 3))
+                    logger.debug(
+                        "%sをリトライします (%d/%d回目, %.3f秒後): %s",
+                        func.__name__, attempt + 1, max_attempts, delay, e
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+        return wrapper
+    return decorator
+
+
 class RMF:
     """リモートMCPとの通信を管理するクラス"""
 
@@ -29,7 +122,14 @@ class RMF:
             "max_attempts": 3,
             "initial_delay": 0.1,
             "max_delay": 1.0
-        }
+        },
+        "connection": {
+            "limit": 100,
+            "limit_per_host": 32,
+            "keepalive_timeout": 75.0,
+            "ttl_dns_cache": 60
+        },
+        "tools_cache_ttl": 30.0
     }
 
     def __init__(self, config: Dict[str, Any]):
@@ -42,10 +142,25 @@ class RMF:
                 - base_url: ベースURL
                 - timeout: タイムアウト秒数（デフォルト: 5）
                 - headers: リクエストヘッダー（オプション）
+                - write_tools: 呼び出し後にツール一覧のキャッシュを破棄するツール名のリスト（オプション）
+                - dedupe_tools: 実行中の同一呼び出しを共有してよい（副作用のない）ツール名のリスト（オプション）
+              - timeouts: 全MCP共通のタイムアウト設定（オプション）
+                - connect: 接続タイムアウト秒数（デフォルト: 0.1）
+                - read: 読み取りタイムアウト秒数（デフォルト: 5.0）
+              - retry: リトライ設定（オプション）
+                - max_attempts: 最大試行回数
+                - initial_delay: 最初の待機秒数
+                - max_delay: 最大の待機秒数
               - logging: ロギング設定（オプション）
                 - level: ログレベル
                 - file: ログファイル名
                 - format: ログフォーマット
+              - connection: コネクションプール設定（オプション）
+                - limit: 全体の最大同時接続数
+                - limit_per_host: ホストごとの最大同時接続数
+                - keepalive_timeout: アイドル接続を保持する秒数
+                - ttl_dns_cache: DNS解決結果をキャッシュする秒数
+              - tools_cache_ttl: ツール一覧をキャッシュする秒数（0以下で無効、デフォルト: 30）
         
         Raises:
             ConfigError: 必須設定が不足している場合
@@ -66,7 +181,10 @@ class RMF:
         # ロギング設定
         self.logger = setup_logging(self.config["logging"])
         self._session = None
+        # MCP名 -> (取得時刻, ツール一覧, ETag)
         self._tools_cache = {}
+        # (MCP名, ツール名, 正規化した引数) -> 実行中の呼び出し
+        self._inflight = {}
     
     def _merge_config(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
         """設定をマージする（デフォルト値に上書き）
@@ -78,18 +196,25 @@ class RMF:
         Returns:
             マージした設定
         """
-        result = default.copy()
+        # 再帰せずスタックで走査する。deepcopyは行わず、デフォルト値のディクショナリのみ
+        # 階層ごとに浅く複製する（DEFAULT_CONFIGの末端の値は変更不可な型のため共有してよい）
+        result = dict(default)
+        stack = [(result, user)]
         
-        for key, value in user.items():
-            # 既存のディクショナリ値は再帰的にマージ
-            if (
-                key in result and
-                isinstance(result[key], dict) and
-                isinstance(value, dict)
-            ):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
+        while stack:
+            target, source = stack.pop()
+            # この時点のtargetはデフォルト値のキーのみを持つ
+            for key, value in target.items():
+                if isinstance(value, dict):
+                    override = source.get(key, {})
+                    if isinstance(override, dict):
+                        target[key] = child = dict(value)
+                        stack.append((child, override))
+            
+            for key, value in source.items():
+                # 双方がディクショナリの場合はスタック側でマージ済み
+                if not (isinstance(target.get(key), dict) and isinstance(value, dict)):
+                    target[key] = value
                 
         return result
     
@@ -99,6 +224,11 @@ class RMF:
         Raises:
             ConfigError: MCP設定が無効な場合
         """
+        # MCP名 -> MCP設定（同名のMCPがある場合は先に設定されたものを使用）
+        self._mcp_by_name = {}
+        # 呼び出し側の設定を変更しないよう、各MCP設定はコピーして正規化する
+        remote_mcps = []
+        
         for i, mcp in enumerate(self.config["remote_mcps"]):
             # 必須パラメータのチェック
             if "name" not in mcp:
@@ -113,12 +243,51 @@ class RMF:
                     {"mcp_name": mcp.get("name", f"#{i+1}")}
                 )
             
-            # デフォルト値の設定
-            if "timeout" not in mcp:
-                mcp["timeout"] = 5.0
-                
-            if "headers" not in mcp:
-                mcp["headers"] = None
+            mcp = self._prepare_mcp(dict(mcp))
+            remote_mcps.append(mcp)
+            self._mcp_by_name.setdefault(mcp["name"], mcp)
+        
+        self.config["remote_mcps"] = remote_mcps
+
+    def _prepare_mcp(self, mcp: Dict[str, Any]) -> Dict[str, Any]:
+        """MCP設定にデフォルト値とリクエスト用の値を設定する
+        
+        URLやヘッダーはリクエストごとに組み立てず、ここで一度だけ作成します。
+        
+        Args:
+            mcp: MCPの設定情報（直接更新される）
+            
+        Returns:
+            更新したMCPの設定情報
+        """
+        # デフォルト値の設定
+        if "timeout" not in mcp:
+            mcp["timeout"] = 5.0
+            
+        if "headers" not in mcp:
+            mcp["headers"] = None
+        
+        base_url = mcp["base_url"].rstrip("/")
+        mcp["_tools_list_url"] = f"{base_url}/tools/list"
+        mcp["_tools_call_url"] = f"{base_url}/tools/call"
+        mcp["_tools_call_headers"] = {"Content-Type": "application/json", **(mcp["headers"] or {})}
+        mcp["_write_tools"] = frozenset(mcp.get("write_tools") or ())
+        mcp["_dedupe_tools"] = frozenset(mcp.get("dedupe_tools") or ()) - mcp["_write_tools"]
+        
+        # 接続タイムアウトを短く、読み取りタイムアウトを長めに設定
+        timeouts = self.config["timeouts"]
+        mcp["_client_timeout"] = aiohttp.ClientTimeout(
+            total=mcp["timeout"],
+            connect=timeouts["connect"],
+            sock_read=timeouts["read"]
+        )
+        # ストリーミングは全体の時間を制限せず、受信が途切れた場合のみタイムアウトとする
+        mcp["_stream_timeout"] = aiohttp.ClientTimeout(
+            total=None,
+            connect=timeouts["connect"],
+            sock_read=timeouts["read"]
+        )
+        return mcp
 
     async def __aenter__(self):
         """非同期コンテキストマネージャーのエントリーポイント"""
@@ -132,7 +301,21 @@ class RMF:
     async def setup(self):
         """初期セットアップ"""
         if self._session is None:
-            connector = aiohttp.TCPConnector(enable_cleanup_closed=True)
+            # アイドル時間がaiohttp既定の15秒を超えても接続を再利用できるよう、
+            # keep-aliveを一般的なサーバー側の既定値（nginxの75秒）に合わせる
+            connection = self.config["connection"]
+            # aiodnsが利用可能な場合は、スレッドプールを使わずにイベントループ上で名前解決を行う
+            # （インポートのコストを避けるため、存在の確認のみ行う）
+            has_aiodns = importlib.util.find_spec("aiodns") is not None
+            resolver = aiohttp.AsyncResolver() if has_aiodns else None
+            connector = aiohttp.TCPConnector(
+                resolver=resolver,
+                limit=connection["limit"],
+                limit_per_host=connection["limit_per_host"],
+                keepalive_timeout=connection["keepalive_timeout"],
+                ttl_dns_cache=connection["ttl_dns_cache"],
+                enable_cleanup_closed=True,
+            )
             self._session = aiohttp.ClientSession(connector=connector)
 
     async def cleanup(self):
@@ -141,12 +324,7 @@ class RMF:
             await self._session.close()
             self._session = None
 
-    @backoff.on_exception(
-        backoff.expo,
-        (RMFError, TimeoutError, ConnectionError),
-        max_tries=3,
-        max_time=30,
-    )
+    @_retry_on(RMFError, TimeoutError, ConnectionError)
     async def _fetch_tools_from_remote(self, mcp_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """リモートMCPからツール一覧を取得
 
@@ -161,26 +339,44 @@ class RMF:
             TimeoutError: タイムアウト発生
             ConnectionError: 接続エラー発生
         """
+        # 有効期限内のキャッシュがあればリモートへ問い合わせない
+        ttl = self.config["tools_cache_ttl"]
+        cached = self._tools_cache.get(mcp_config["name"])
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        if "_tools_list_url" not in mcp_config:
+            mcp_config = self._prepare_mcp(dict(mcp_config))
+        
+        # 期限切れでもETagがあれば条件付きGETで再検証する
+        headers = mcp_config["headers"]
+        if cached is not None and cached[2] is not None:
+            headers = {**(headers or {}), "If-None-Match": cached[2]}
+        
         with LogContext(function="_fetch_tools_from_remote", mcp_name=mcp_config["name"]):
-            logger.info("ツール一覧の取得開始", details={"base_url": mcp_config["base_url"]})
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("ツール一覧の取得開始", details={"base_url": mcp_config["base_url"]})
 
             try:
-                # 接続タイムアウトを短く、読み取りタイムアウトを長めに設定
-                timeout = aiohttp.ClientTimeout(
-                    total=mcp_config["timeout"],
-                    connect=0.1,  # 接続タイムアウトを0.1秒に設定
-                    sock_read=5.0  # 読み取りタイムアウトを5秒に設定
-                )
-
                 try:
                     async with self._session.get(
-                        f"{mcp_config['base_url']}/tools/list",
-                        timeout=timeout,
-                        headers=mcp_config.get("headers"),
+                        mcp_config["_tools_list_url"],
+                        timeout=mcp_config["_client_timeout"],
+                        headers=headers,
                     ) as response:
-                        if response.status == 200:
-                            tools = await response.json()
-                            logger.info("ツール一覧の取得成功", details={"tool_count": len(tools)})
+                        if response.status == 304 and cached is not None:
+                            # 変更がなければ本文を受信・解析せずキャッシュを延長する
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("ツール一覧に変更なし", details={"tool_count": len(cached[1])})
+                            self._tools_cache[mcp_config["name"]] = (time.monotonic(), cached[1], cached[2])
+                            return cached[1]
+                        elif response.status == 200:
+                            tools = await response.json(loads=_json_loads)
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("ツール一覧の取得成功", details={"tool_count": len(tools)})
+                            etag = response.headers.get("ETag")
+                            if ttl > 0 or etag is not None:
+                                self._tools_cache[mcp_config["name"]] = (time.monotonic(), tools, etag)
                             return tools
                         else:
                             raise RMFError(f"ツール一覧の取得エラー: HTTP {response.status}")
@@ -197,12 +393,7 @@ class RMF:
                 logger.error("ツール一覧の取得タイムアウト", details={"timeout": mcp_config["timeout"]})
                 raise TimeoutError(f"ツール一覧の取得タイムアウト: {mcp_config['timeout']}秒") from e
 
-    @backoff.on_exception(
-        backoff.expo,
-        (ToolError, TimeoutError, ConnectionError),
-        max_tries=3,
-        max_time=30,
-    )
+    @_retry_on(ToolError, TimeoutError, ConnectionError)
     async def _call_remote_tool(
         self,
         mcp_config: Dict[str, Any],
@@ -224,6 +415,9 @@ class RMF:
             TimeoutError: タイムアウト発生
             ConnectionError: 接続エラー発生
         """
+        if "_tools_call_url" not in mcp_config:
+            mcp_config = self._prepare_mcp(dict(mcp_config))
+        
         with LogContext(
             function="_call_remote_tool",
             tool=tool,
@@ -233,23 +427,22 @@ class RMF:
             logger.info("ツール呼び出し開始")
 
             try:
-                # 接続タイムアウトを短く、読み取りタイムアウトを長めに設定
-                timeout = aiohttp.ClientTimeout(
-                    total=mcp_config["timeout"],
-                    connect=0.1,  # 接続タイムアウトを0.1秒に設定
-                    sock_read=5.0  # 読み取りタイムアウトを5秒に設定
-                )
-
                 try:
                     async with self._session.post(
-                        f"{mcp_config['base_url']}/tools/call",
-                        json={"tool": tool, "arguments": arguments},
-                        timeout=timeout,
-                        headers=mcp_config.get("headers"),
+                        mcp_config["_tools_call_url"],
+                        data=_json_dumps_bytes({"tool": tool, "arguments": arguments}),
+                        timeout=mcp_config["_client_timeout"],
+                        headers=mcp_config["_tools_call_headers"],
                     ) as response:
                         if response.status == 200:
-                            result = await response.json()
-                            logger.info("ツール呼び出し成功", details={"result": result})
+                            body = await response.read()
+                            result = _json_loads(body)
+                            # 実行結果は大きくなりうるため、本文全体ではなくサイズと形だけを記録する
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("ツール呼び出し成功", details={
+                                    "result_bytes": len(body),
+                                    "result_keys": list(result)[:16] if isinstance(result, dict) else None
+                                })
                             return result
                         else:
                             raise ToolError(f"ツール呼び出し失敗: {tool} (HTTP {response.status})")
@@ -275,13 +468,47 @@ class RMF:
         Returns:
             ツール情報のリスト
         """
+        # 各MCPへの問い合わせは独立しているため並行して実行する
+        results = await asyncio.gather(
+            *(
+                self._fetch_tools_from_remote(mcp)
+                for mcp in self.config["remote_mcps"]
+                if mcp_name is None or mcp["name"] == mcp_name
+            ),
+            return_exceptions=True,
+        )
+        
+        # すべての問い合わせの完了後、MCPの設定順に結果をまとめる
         tools = []
-        for mcp in self.config["remote_mcps"]:
-            if mcp_name is None or mcp["name"] == mcp_name:
-                mcp_tools = await self._fetch_tools_from_remote(mcp)
-                tools.extend(mcp_tools)
+        for mcp_tools in results:
+            if isinstance(mcp_tools, BaseException):
+                raise mcp_tools
+            tools.extend(mcp_tools)
         return tools
 
+    def invalidate_tools(self, mcp_name: str = None):
+        """ツール一覧のキャッシュを破棄
+        
+        Args:
+            mcp_name: MCP名（指定がない場合は全てのMCP）
+        """
+        if mcp_name is None:
+            self._tools_cache.clear()
+        else:
+            self._tools_cache.pop(mcp_name, None)
+
+    def is_write_tool(self, tool: str, mcp_name: str = None) -> bool:
+        """状態を変更するツール（write_tools）かどうかを判定
+        
+        Args:
+            tool: ツール名
+            mcp_name: MCP名（指定がない場合は最初のMCP）
+            
+        Returns:
+            呼び出し後にツール一覧のキャッシュを破棄するツールの場合True
+        """
+        return tool in self._find_mcp(mcp_name)["_write_tools"]
+
     async def call_tool(
         self,
         tool: str,
@@ -290,6 +517,10 @@ class RMF:
     ) -> Dict[str, Any]:
         """ツールを呼び出す
 
+        dedupe_tools に指定されたツールは、同じMCP・ツール・引数の呼び出しが実行中の
+        場合にリモートへ重複してリクエストせず、実行中の呼び出しの結果を共有します。
+        呼び出し元ごとに結果のコピーを返すため、変更しても他の呼び出し元には影響しません。
+
         Args:
             tool: ツール名
             arguments: ツールの引数
@@ -302,11 +533,200 @@ class RMF:
             ValueError: 指定されたMCPが見つからない
             ToolError: ツール呼び出しに失敗
         """
-        for mcp in self.config["remote_mcps"]:
-            if mcp_name is None or mcp["name"] == mcp_name:
+        mcp = self._find_mcp(mcp_name)
+        if tool in mcp["_write_tools"]:
+            try:
                 return await self._call_remote_tool(mcp, tool, arguments)
+            finally:
+                # 状態を変更するツールは失敗時も変更済みの可能性があるため、常にキャッシュを破棄する
+                self.invalidate_tools(mcp["name"])
+
+        # 副作用の有無が不明なツールは共有せず、呼び出しごとに実行する
+        if tool not in mcp["_dedupe_tools"]:
+            return await self._call_remote_tool(mcp, tool, arguments)
+
+        key = (mcp["name"], tool, _canonical_json(arguments))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call_remote_tool(mcp, tool, arguments))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish_inflight, key))
+
+        # 呼び出し元が取り消されても、結果を待つ他の呼び出し元のために実行は継続する
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _finish_inflight(self, key: tuple, task: asyncio.Future):
+        """完了した呼び出しを実行中の一覧から外す
+
+        Args:
+            key: 実行中の呼び出しのキー
+            task: 完了した呼び出し
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 全ての呼び出し元が取り消された場合も、例外が未取得として警告されないようにする
+        if not task.cancelled():
+            task.exception()
+
+    async def call_tools_batch(
+        self,
+        calls: List[tuple],
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """複数のツールを並行して呼び出す
+
+        同時に実行する呼び出し数を制限し、共有セッションの接続を再利用します。
+        いずれかの呼び出しが失敗した場合は、残りの呼び出しを取り消して例外を送出します。
+
+        Args:
+            calls: (ツール名, 引数) または (ツール名, 引数, MCP名) のリスト
+            concurrency: 同時に実行する呼び出し数の上限
+              （指定がない場合は connection.limit_per_host）
+
+        Returns:
+            ツールの実行結果のリスト（calls と同じ順序）
+
+        Raises:
+            ValueError: 指定されたMCPが見つからない
+            ToolError: ツール呼び出しに失敗
+        """
+        if concurrency is None:
+            concurrency = self.config["connection"]["limit_per_host"]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_call(call):
+            async with semaphore:
+                return await self.call_tool(*call)
+
+        # Python 3.8以降で動作するよう、TaskGroupと同様の取り消しをgatherで行う
+        tasks = [asyncio.ensure_future(bounded_call(call)) for call in calls]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def call_tool_stream(
+        self,
+        tool: str,
+        arguments: Dict[str, Any],
+        mcp_name: str = None,
+    ) -> AsyncIterator[Any]:
+        """ツールを呼び出し、受信した結果から順に返す
 
-        if mcp_name:
+        レスポンスがJSON Lines（application/x-ndjson など）の場合は、受信した行から
+        解析して返すため、本文全体をメモリに保持しません。それ以外の場合は本文全体を
+        1つの値として返します。途中まで返した結果を重複させないよう、リトライは行いません。
+        全体の所要時間は制限せず、受信の間隔が読み取りタイムアウトを超えた場合に
+        タイムアウトとします。
+
+        Args:
+            tool: ツール名
+            arguments: ツールの引数
+            mcp_name: MCP名（指定がない場合は最初に一致するMCP）
+
+        Yields:
+            ツールの実行結果（JSON Linesの場合は1行ごとの値）
+
+        Raises:
+            ValueError: 指定されたMCPが見つからない
+            ToolError: ツール呼び出しに失敗、またはJSONとして解析できない行を受信
+            TimeoutError: タイムアウト発生
+            ConnectionError: 接続エラー発生
+        """
+        mcp_config = self._find_mcp(mcp_name)
+        details = {"tool": tool, "mcp_name": mcp_config["name"]}
+        logger.info("ツールのストリーミング呼び出し開始", details=details)
+
+        def parse_line(line: bytes, line_number: int) -> Any:
+            try:
+                return _json_loads(line)
+            except ValueError as e:
+                logger.error("ストリーミング結果の解析エラー", details={**details, "line": line_number, "error": str(e)})
+                raise ToolError(
+                    f"ストリーミング結果の解析に失敗: {tool} ({line_number}行目)",
+                    {**details, "line": line_number}
+                ) from e
+
+        try:
+            try:
+                async with self._session.post(
+                    mcp_config["_tools_call_url"],
+                    data=_json_dumps_bytes({"tool": tool, "arguments": arguments}),
+                    timeout=mcp_config["_stream_timeout"],
+                    headers=mcp_config["_tools_call_headers"],
+                ) as response:
+                    if response.status != 200:
+                        raise ToolError(f"ツール呼び出し失敗: {tool} (HTTP {response.status})")
+
+                    if response.content_type not in _NDJSON_CONTENT_TYPES:
+                        yield await response.json(loads=_json_loads)
+                        return
+
+                    # 改行までを1件として、受信済みのチャンクから順に解析する
+                    # （未完了の行は連結し直さず、追加分のみ改行を探索する）
+                    # JSON Text Sequencesは「RS + JSON + 改行」の形式のため、先頭のRSを除いて解析する
+                    json_seq = response.content_type == _JSON_SEQ_CONTENT_TYPE
+                    count = 0
+                    line_number = 0
+                    buffer = bytearray()
+                    async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                        search_from = len(buffer)
+                        buffer += chunk
+                        start = 0
+                        while (end := buffer.find(b"\n", search_from)) != -1:
+                            line = bytes(buffer[start:end])
+                            if json_seq:
+                                line = line.lstrip(_RECORD_SEPARATOR)
+                            start = search_from = end + 1
+                            line_number += 1
+                            if line.strip():
+                                count += 1
+                                yield parse_line(line, line_number)
+                        if start:
+                            del buffer[:start]
+                    if json_seq:
+                        buffer = buffer.lstrip(_RECORD_SEPARATOR)
+                    if buffer.strip():
+                        count += 1
+                        yield parse_line(bytes(buffer), line_number + 1)
+
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("ツールのストリーミング呼び出し成功", details={**details, "item_count": count})
+
+            except aiohttp.ClientError as e:
+                logger.error("ツール呼び出しエラー", details={**details, "error": str(e)})
+                raise ConnectionError(f"ツール呼び出しエラー: {str(e)}") from e
+
+        except asyncio.TimeoutError as e:
+            timeout = mcp_config["_stream_timeout"].sock_read
+            logger.error("ツール呼び出しタイムアウト", details={**details, "timeout": timeout})
+            raise TimeoutError(f"ツール呼び出しタイムアウト: {timeout}秒") from e
+
+        finally:
+            if tool in mcp_config["_write_tools"]:
+                self.invalidate_tools(mcp_config["name"])
+
+    def _find_mcp(self, mcp_name: Optional[str]) -> Dict[str, Any]:
+        """呼び出し先のMCP設定を取得
+
+        Args:
+            mcp_name: MCP名（指定がない場合は最初のMCP）
+
+        Returns:
+            MCPの設定情報
+
+        Raises:
+            ValueError: 指定されたMCPが見つからない
+        """
+        # 設定時に作成した索引から取得する
+        if mcp_name is None:
+            return self.config["remote_mcps"][0]
+
+        mcp = self._mcp_by_name.get(mcp_name)
+        if mcp is None:
             raise ValueError(f"指定されたMCP '{mcp_name}' が見つかりません")
-        else:
-            raise ValueError("利用可能なMCPが見つかりません") 
\ No newline at end of file
+        return mcp
+ 
\ No newline at end of file
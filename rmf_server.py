@@ -7,18 +7,40 @@ FastAPIを使用して、標準的なMCPエンドポイント（/tools/list, /to
 import asyncio
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 import os
-import yaml
-from rmf import RemoteMCPFetcher, RetryConfig, RemoteMCPConfig
+from rmf import RemoteMCPFetcher, RetryConfig, RemoteMCPConfig, LogContext
+from rmf.config import safe_int, safe_float, safe_bool
+from rmf.errors import ConfigError
+from rmf.logging import SafeRotatingFileHandler
+import atexit
 import logging
-import uuid
-from datetime import datetime
+import logging.handlers
+import queue
+import time
+
+# orjsonが利用可能な場合はC実装でレスポンスをエンコードする
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjsonは任意の依存関係
+    orjson = None
+
+class ORJSONResponse(JSONResponse):
+    """orjsonでエンコードするJSONレスポンス
+    
+    FastAPIのORJSONResponseは新しいバージョンで非推奨となったため、同等のものを定義します。
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+# 全エンドポイントの既定のレスポンスクラス
+response_class = ORJSONResponse if orjson is not None else JSONResponse
 
 # アプリケーションの初期化
-app = FastAPI(title="Remote MCP Fetcher Server")
+app = FastAPI(title="Remote MCP Fetcher Server", default_response_class=response_class)
 
 # グローバル変数
 rmf = None
@@ -26,6 +48,21 @@ config_path = os.environ.get("RMF_CONFIG", "config.yaml")
 logger = logging.getLogger("rmf_server")
 startup_error = None
 
+# リクエストごとのアクセスログを出力するか（RMF_ACCESS_LOG=0 で無効）
+# 不正な値でモジュールのインポートが失敗しないよう、デフォルト値を使用して警告する
+try:
+    access_log_enabled = safe_bool(os.environ.get("RMF_ACCESS_LOG"), True, "RMF_ACCESS_LOG")
+except ConfigError as e:
+    access_log_enabled = True
+    logger.warning("%s（デフォルト値 true を使用します）", e.message)
+
+# /tools/list の応答をキャッシュする秒数（RMF_TOOLS_TTL=0 で無効）
+tools_cache_ttl = safe_float(os.environ.get("RMF_TOOLS_TTL"), 10.0, "RMF_TOOLS_TTL")
+
+# /tools/list の応答キャッシュ（取得時刻, エンコード済みの本文）
+_tools_cache = {"ts": 0.0, "body": None}
+_tools_lock = None
+
 # リクエストモデル
 class ToolCallRequest(BaseModel):
     tool: str
@@ -38,24 +75,54 @@ async def startup_event():
     setup_logging()
     try:
         rmf = RemoteMCPFetcher(config_path)
-        logger.info(f"RMFサーバーを初期化しました（設定ファイル: {config_path}）")
+        logger.info("RMFサーバーを初期化しました（設定ファイル: %s）", config_path)
     except Exception as e:
-        logger.error(f"RMF初期化エラー: {str(e)}")
+        logger.error("RMF初期化エラー: %s", e)
         startup_error = str(e)
         # テスト環境では例外を発生させない
         if not os.environ.get("TESTING"):
             # テスト以外の場合のみ例外を発生させる（サーバー起動時の致命的エラー）
             raise Exception(f"RMF初期化エラー: {str(e)}")
 
+def get_worker_count() -> int:
+    """ワーカープロセス数を取得
+    
+    環境変数 RMF_WORKERS で指定します（デフォルト: 1）。
+    """
+    return safe_int(os.environ.get("RMF_WORKERS"), 1, "RMF_WORKERS")
+
 def setup_logging():
-    """ロギング設定"""
+    """ロギング設定
+    
+    ルートロガーにはキューへ渡すだけのQueueHandlerを設定し、標準エラー出力と
+    ファイルへの書き込みはQueueListenerのスレッドで行います。これにより、
+    イベントループ上でI/Oを待たないようにします。
+    複数ワーカーの場合、各プロセスが同じファイルへ書き込んだりローテーションしたり
+    しないよう、ワーカーごとにプロセスIDを含むファイル名を使用します。
+    """
+    # basicConfigと同様、設定済みの場合は何もしない
+    if logging.getLogger().handlers:
+        return
+    
+    log_file = "rmf_server.log"
+    if get_worker_count() > 1:
+        log_file = f"rmf_server.{os.getpid()}.log"
+    
+    # フォーマットはQueueHandlerで行うため、出力先のハンドラはメッセージをそのまま書き込む
+    # （リスナーのスレッドから書き込むため、ファイルハンドラ自身の書き込みスレッドは使わない）
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        SafeRotatingFileHandler(log_file, queue_size=0)
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler("rmf_server.log")
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
 
 # フォールバック用の空のMCPを作成する関数
@@ -81,44 +148,64 @@ def create_dummy_rmf():
         
         return dummy_rmf
     except Exception as e:
-        logger.error(f"ダミーRMF作成エラー: {str(e)}")
+        logger.error("ダミーRMF作成エラー: %s", e)
         return None
 
+def generate_request_id() -> str:
+    """リクエストIDを生成
+    
+    uuid.uuid4()と同じ128ビットの乱数を、UUIDオブジェクトを経由せずに
+    16進文字列に変換します。
+    """
+    return os.urandom(16).hex()
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """リクエストとレスポンスのログを記録"""
-    request_id = str(uuid.uuid4())
-    start_time = datetime.now()
+    if not access_log_enabled:
+        return await call_next(request)
     
-    # リクエスト情報のログ
-    logger.info(
-        f"リクエスト: {request.method} {request.url.path}",
-        extra={
-            "request_id": request_id,
-            "client_ip": request.client.host,
-            "method": request.method,
-            "path": request.url.path
-        }
-    )
+    request_id = generate_request_id()
+    start_time = time.perf_counter()
     
-    # レスポンス処理
-    try:
-        response = await call_next(request)
-        process_time = (datetime.now() - start_time).total_seconds()
-        
-        # レスポンス情報のログ
+    # INFOログが出力されない場合はextraの辞書を作成しない
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    
+    # リクエスト情報のログ
+    if info_enabled:
+        method = request.method
+        path = request.url.path
         logger.info(
-            f"レスポンス: {response.status_code} ({process_time:.3f}秒)",
+            "リクエスト: %s %s", method, path,
             extra={
                 "request_id": request_id,
-                "status_code": response.status_code,
-                "process_time": process_time
+                "client_ip": request.client.host if request.client else "-",
+                "method": method,
+                "path": path
             }
         )
+    
+    # レスポンス処理
+    # リクエストIDはリクエスト単位で一度だけ生成し、処理中のRMFのログに付加する
+    try:
+        with LogContext(request_id=request_id):
+            response = await call_next(request)
+        process_time = time.perf_counter() - start_time
+        
+        # レスポンス情報のログ
+        if info_enabled:
+            logger.info(
+                "レスポンス: %s (%.3f秒)", response.status_code, process_time,
+                extra={
+                    "request_id": request_id,
+                    "status_code": response.status_code,
+                    "process_time": process_time
+                }
+            )
         return response
     except Exception as e:
         logger.error(
-            f"エラー: {str(e)}",
+            "エラー: %s", e,
             extra={
                 "request_id": request_id,
                 "exception": str(e)
@@ -126,6 +213,44 @@ async def log_requests(request: Request, call_next):
         )
         raise
 
+async def get_tools_body() -> bytes:
+    """ツール一覧の応答本文を取得
+    
+    ツール一覧はほとんど変化しないため、tools_cache_ttl秒の間はエンコード済みの
+    本文を再利用します。期限切れ時に同時に届いたリクエストは、1回の取得結果を共有します。
+    tools_cache_ttlが0以下の場合はキャッシュせず、リクエストごとに並行して取得します。
+    
+    Returns:
+        bytes: JSONエンコード済みの応答本文
+    """
+    global _tools_lock
+    
+    if tools_cache_ttl <= 0:
+        tools = await rmf.get_tools()
+        logger.info("ツール一覧を取得しました（%d件）", len(tools))
+        return response_class(content={"tools": tools}).body
+    
+    body = _tools_cache["body"]
+    if body is not None and time.monotonic() - _tools_cache["ts"] < tools_cache_ttl:
+        return body
+    
+    # イベントループの起動後に作成する（Python 3.9以前はLockが作成時のループに束縛されるため）
+    if _tools_lock is None:
+        _tools_lock = asyncio.Lock()
+    
+    async with _tools_lock:
+        # ロック待ちの間に他のリクエストが更新した場合はそれを使用
+        body = _tools_cache["body"]
+        if body is not None and time.monotonic() - _tools_cache["ts"] < tools_cache_ttl:
+            return body
+        
+        tools = await rmf.get_tools()
+        logger.info("ツール一覧を取得しました（%d件）", len(tools))
+        body = response_class(content={"tools": tools}).body
+        _tools_cache["ts"] = time.monotonic()
+        _tools_cache["body"] = body
+        return body
+
 @app.get("/tools/list")
 async def list_tools():
     """利用可能なツール一覧を返す"""
@@ -146,11 +271,9 @@ async def list_tools():
                 raise HTTPException(status_code=500, detail="RMFサーバーが初期化されていません")
     
     try:
-        tools = await rmf.get_tools()
-        logger.info(f"ツール一覧を取得しました（{len(tools)}件）")
-        return {"tools": tools}
+        return Response(content=await get_tools_body(), media_type="application/json")
     except Exception as e:
-        logger.error(f"ツール一覧取得エラー: {str(e)}")
+        logger.error("ツール一覧取得エラー: %s", e)
         raise HTTPException(status_code=500, detail=f"ツール一覧取得エラー: {str(e)}")
 
 @app.post("/tools/call")
@@ -189,13 +312,18 @@ async def call_tool(request: ToolCallRequest):
         if os.environ.get("TESTING") and tool_name != "to_uppercase":
             raise HTTPException(status_code=404, detail=f"ツール呼び出しエラー: Unknown tool: {tool_name}")
         
-        logger.info(f"ツール呼び出し: {tool_name}")
-        result = await rmf.call_tool(tool_name, arguments)
+        logger.info("ツール呼び出し: %s", tool_name)
+        try:
+            result = await rmf.call_tool(tool_name, arguments)
+        finally:
+            # 状態を変更するツールは失敗時も変更済みの可能性があるため、常に応答キャッシュを破棄する
+            if rmf.is_write_tool(tool_name):
+                _tools_cache["body"] = None
         
-        logger.info(f"ツール呼び出し成功: {tool_name}")
+        logger.info("ツール呼び出し成功: %s", tool_name)
         return {"content": result}
     except Exception as e:
-        logger.error(f"ツール呼び出しエラー: {str(e)}")
+        logger.error("ツール呼び出しエラー: %s", e)
         error_message = str(e)
         status_code = 500
         
@@ -208,30 +336,64 @@ async def call_tool(request: ToolCallRequest):
             
         raise HTTPException(status_code=status_code, detail=f"ツール呼び出しエラー: {error_message}")
 
+# 内容が変わらない応答は起動時に一度だけエンコードする
+_HEALTH_BODY = response_class(content={"status": "healthy", "version": "0.1.0"}).body
+_ROOT_BODY = response_class(content={
+    "name": "Remote MCP Fetcher Server",
+    "version": "0.1.0",
+    "endpoints": [
+        {"path": "/tools/list", "method": "GET", "description": "利用可能なツール一覧を取得"},
+        {"path": "/tools/call", "method": "POST", "description": "指定されたツールを呼び出し"},
+        {"path": "/health", "method": "GET", "description": "ヘルスチェック"}
+    ]
+}).body
+
 @app.get("/health")
 async def health_check():
     """ヘルスチェックエンドポイント"""
     if rmf is None and not os.environ.get("TESTING"):
         raise HTTPException(status_code=503, detail="RMFサーバーが初期化されていません")
-    return {"status": "healthy", "version": "0.1.0"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/")
 async def root():
     """ルートエンドポイント"""
-    return {
-        "name": "Remote MCP Fetcher Server",
-        "version": "0.1.0",
-        "endpoints": [
-            {"path": "/tools/list", "method": "GET", "description": "利用可能なツール一覧を取得"},
-            {"path": "/tools/call", "method": "POST", "description": "指定されたツールを呼び出し"},
-            {"path": "/health", "method": "GET", "description": "ヘルスチェック"}
-        ]
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+def get_app_import_string() -> str:
+    """複数ワーカー起動時にuvicornへ渡すアプリケーションのインポート文字列を取得
+    
+    python -m で実行された場合（__main__）は __spec__ のモジュール名（パッケージ名を含む）を、
+    スクリプトとして直接実行された場合（__spec__ がない）はファイル名をモジュール名とします。
+    """
+    module_name = __name__
+    if module_name == "__main__":
+        if __spec__ is not None:
+            module_name = __spec__.name
+        else:
+            module_name = os.path.splitext(os.path.basename(__file__))[0]
+    return f"{module_name}:app"
 
 def main():
-    """サーバー起動"""
+    """サーバー起動
+    
+    ワーカープロセス数は環境変数 RMF_WORKERS で指定します（デフォルト: 1）。
+    各ワーカーは startup_event で個別にRMFを初期化します。
+    """
     try:
-        uvicorn.run(app, host="127.0.0.1", port=8004, log_level="info")
+        # 1プロセスのイベントループでは1コアしか使えないため、必要に応じてRMF_WORKERSで増やす
+        workers = get_worker_count()
+        
+        # uvicornの既定（loop・httpとも"auto"）で、uvloop・httptoolsがインストールされていれば使用される
+        # （rmf-server[fast]で導入。uvloopはWindows非対応のため未導入時は標準のasyncioを使用）
+        # 複数ワーカーの場合、uvicornはアプリケーションをインポート文字列で受け取る必要がある
+        uvicorn.run(
+            app if workers == 1 else get_app_import_string(),
+            host="127.0.0.1",
+            port=8004,
+            log_level="info",
+            workers=workers
+        )
     except Exception as e:
         print(f"サーバー起動エラー: {str(e)}")
 
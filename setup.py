@@ -12,6 +12,10 @@ setup(
         "aiohttp-sse>=2.1.0"
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "aiodns>=3.0.0"
+        ],
         "test": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.18.0",
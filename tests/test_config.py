@@ -1,12 +1,13 @@
 """設定管理の統合テスト"""
 
 import os
+import sys
 import pytest
 import json
 import logging
 import tempfile
 from pathlib import Path
-from rmf.config import Config
+from rmf.config import Config, safe_int, safe_float, _read_env_overrides
 from rmf.errors import ConfigError
 from tests.utils import test_env, log_test_env, temp_log_file
 
@@ -101,6 +102,45 @@ def test_invalid_values():
     assert exc_info.value.details['expected_type'] == 'integer'
 
 
+def test_sse_enabled_values():
+    """SSE有効化フラグの解釈テスト"""
+    os.environ['RMF_SERVER_SSE_ENABLED'] = 'off'
+    assert Config().server['sse_enabled'] is False
+    
+    os.environ['RMF_SERVER_SSE_ENABLED'] = 'Yes'
+    assert Config().server['sse_enabled'] is True
+    
+    # 真の値以外はエラーにせずFalseとする
+    for value in ('disabled', '', 'invalid'):
+        os.environ['RMF_SERVER_SSE_ENABLED'] = value
+        assert Config().server['sse_enabled'] is False
+
+
+def test_safe_numeric_conversion():
+    """数値変換のテスト"""
+    assert safe_int('42', 0, 'P') == 42
+    assert safe_int(' -7 ', 0, 'P') == -7
+    assert safe_float('0.5', 0.0, 'P') == 0.5
+    assert safe_float('-1e-3', 0.0, 'P') == -0.001
+    assert safe_float('.25', 0.0, 'P') == 0.25
+    assert safe_float('inf', 0.0, 'P') == float('inf')
+    
+    for invalid in ['1.5', '²', '']:
+        with pytest.raises(ConfigError):
+            safe_int(invalid, 0, 'P')
+    with pytest.raises(ConfigError):
+        safe_float('abc', 0.0, 'P')
+    
+    # 値がない場合はデフォルト値を返す
+    assert safe_int(None, 3, 'P') == 3
+    assert safe_float(None, 0.1, 'P') == 0.1
+    
+    # キャッシュ済みの値でも同じ結果になる
+    assert safe_int('42', 0, 'Q') == 42
+    with pytest.raises(ConfigError):
+        safe_float('abc', 0.0, 'Q')
+
+
 def test_get_config():
     """get_config()メソッドのテスト"""
     config = Config()
@@ -175,4 +215,68 @@ def test_error_logging(log_test_env):
     # エラーログの内容を確認
     assert 'Invalid integer value for RMF_MCP_TIMEOUT' in error_log['message']
     assert 'error' in error_log
-    assert error_log['error']['type'] == 'ConfigError' 
\ No newline at end of file
+    assert error_log['error']['type'] == 'ConfigError' 
+
+def test_lazy_singleton():
+    """configシングルトンの遅延生成テスト"""
+    import rmf
+    config_module = sys.modules['rmf.config']
+    
+    # 初回アクセス時に生成され、以降は同じインスタンスを返す
+    instance = rmf.config
+    assert isinstance(instance, Config)
+    assert rmf.config is instance
+    assert config_module.config is instance
+
+
+def test_cached_views():
+    """設定辞書のキャッシュテスト"""
+    config = Config()
+    
+    # 同じ辞書オブジェクトが返される
+    assert config.server is config.server
+    assert config.logging is config.logging
+    assert config.remote_mcps is config.remote_mcps
+    assert config.get_config()['server'] == config.server
+
+
+def test_root_config_shim():
+    """ルートのconfigモジュールがrmf.configを再エクスポートすることをテスト"""
+    import config as root_config
+    config_module = sys.modules['rmf.config']
+
+    assert root_config.Config is config_module.Config
+    assert root_config.config is config_module.config
+
+
+def test_read_env_overrides_snapshot():
+    """環境変数のスナップショットからの読み込みテスト"""
+    overrides = _read_env_overrides({
+        'RMF_MCP_BASE_URL': 'http://example.com',
+        'RMF_SERVER_SSE_ENABLED': 'false',
+        'OTHER': 'ignored'
+    })
+    
+    assert overrides['mcp'] == {'base_url': 'http://example.com'}
+    assert overrides['server'] == {'sse_enabled': 'false'}
+    assert overrides['retry'] == {}
+    assert overrides['logging'] == {}
+
+
+def test_config_views_types():
+    """設定ビューの型と、get_config()が独立したコピーを返すことのテスト"""
+    config = Config()
+    
+    # プロパティは通常の辞書・リストを返し、JSONに変換できる
+    assert type(config.remote_mcps) is list
+    assert type(config.remote_mcps[0]) is dict
+    assert type(config.logging) is dict
+    assert type(config.server) is dict
+    json.dumps(config.get_config())
+    json.dumps({'remote_mcps': config.remote_mcps, 'logging': config.logging, 'server': config.server})
+    
+    full_config = config.get_config()
+    full_config['remote_mcps'][0]['retry']['max_attempts'] = 99
+    full_config['logging']['level'] = 'ERROR'
+    assert config.remote_mcps[0]['retry']['max_attempts'] == 3
+    assert config.logging['level'] == 'INFO'
@@ -128,4 +128,29 @@ def test_set_and_clear(env_manager):
     env_manager.set('TEST2', 'value2')
     env_manager.clear_all()
     assert env_manager.get('TEST1') is None
-    assert env_manager.get('TEST2') is None 
\ No newline at end of file
+    assert env_manager.get('TEST2') is None 
+
+def test_parse_cache(env_manager, monkeypatch):
+    """変換結果キャッシュのテスト"""
+    monkeypatch.setenv('TEST_CACHED_INT', '10')
+    assert env_manager.get_int('CACHED_INT', 0) == 10
+    assert env_manager.get_int('CACHED_INT', 0) == 10
+    
+    # 外部から値が変更された場合は再変換される
+    monkeypatch.setenv('TEST_CACHED_INT', '20')
+    assert env_manager.get_int('CACHED_INT', 0) == 20
+    
+    # キャッシュしたリストを変更しても次回の取得に影響しない
+    monkeypatch.setenv('TEST_CACHED_LIST', 'a,b')
+    env_manager.get_list('CACHED_LIST', []).append('c')
+    assert env_manager.get_list('CACHED_LIST', []) == ['a', 'b']
+
+
+def test_prefix_change(env_manager, monkeypatch):
+    """プレフィックス変更時のテスト"""
+    monkeypatch.setenv('TEST_KEY', 'test')
+    monkeypatch.setenv('OTHER_KEY', 'other')
+    assert env_manager.get('KEY') == 'test'
+    
+    env_manager.prefix = 'OTHER_'
+    assert env_manager.get('KEY') == 'other'
@@ -0,0 +1,206 @@
+"""エラー処理のテスト"""
+
+import copy
+import logging
+import pickle
+import pytest
+from rmf.errors import (
+    ErrorHandler,
+    BaseError,
+    RMFError,
+    ConfigError,
+    NetworkError,
+    TimeoutError,
+    ConnectionError,
+    ToolError,
+    SSEError
+)
+from rmf.logging import get_logger
+
+
+@pytest.fixture
+def error_handler():
+    """エラーハンドラを提供するフィクスチャ"""
+    return ErrorHandler(get_logger('rmf.test.errors'))
+
+
+def test_handle_dispatch(error_handler):
+    """エラータイプごとのハンドラ選択のテスト"""
+    class CustomToolError(ToolError):
+        pass
+    
+    class CustomError(BaseError):
+        error_code = 'CUSTOM'
+    
+    expected = [
+        (ConfigError('config'), ConfigError),
+        (NetworkError('network'), NetworkError),
+        (ToolError('tool'), ToolError),
+        (CustomToolError('custom tool'), ToolError),
+        (SSEError('sse'), SSEError),
+        (TimeoutError('timeout'), TimeoutError),
+        (ConnectionError('connection'), ConnectionError),
+        (RMFError('rmf'), RMFError),
+        (CustomError('custom'), BaseError),
+        (ValueError('value'), Exception)
+    ]
+    
+    # 呼び出されたハンドラの登録キーを記録する
+    called = []
+    for error_type in list(error_handler.handlers):
+        error_handler.handlers[error_type] = (
+            lambda error, context, error_type=error_type: called.append(error_type)
+        )
+    
+    for error, handler_type in expected:
+        error_handler.handle(error)
+        assert called.pop() is handler_type
+
+
+def test_handle_result(error_handler):
+    """エラー処理結果のテスト"""
+    result = error_handler.handle(TimeoutError('timed out', {'url': 'http://example.com'}), {'retry_count': 1})
+    assert result['success'] is False
+    assert result['error_code'] == 'TIMEOUT'
+    assert result['details'] == {'url': 'http://example.com'}
+    assert result['retry_recommended'] is True
+    
+    result = error_handler.handle(ValueError('unexpected'))
+    assert result['error_code'] == 'UNKNOWN'
+    assert result['details']['error_type'] == 'ValueError'
+
+
+def test_handle_details(error_handler):
+    """エラー種別ごとの詳細情報のテスト"""
+    records = []
+    error_handler.logger = type('Recorder', (), {
+        'isEnabledFor': lambda self, level: True,
+        'error': lambda self, *args, **kwargs: records.append((args, kwargs))
+    })()
+    
+    result = error_handler.handle(ConnectionError('refused', {'port': 80}), {'host': 'example.com'})
+    args, kwargs = records.pop()
+    assert args == ('%s: %s', '接続エラー', 'refused')
+    assert kwargs['details'] == {
+        'error_type': 'ConnectionError',
+        'error_code': 'CONNECTION',
+        'host': 'example.com',
+        'port': 80
+    }
+    assert result == {
+        'success': False,
+        'error': '[CONNECTION] refused',
+        'error_code': 'CONNECTION',
+        'details': {'port': 80},
+        'retry_recommended': True
+    }
+    
+    result = error_handler.handle(ToolError('missing'))
+    args, kwargs = records.pop()
+    assert kwargs['details']['tool_name'] == 'unknown'
+    assert 'retry_recommended' not in result
+
+
+def test_handle_dispatch_cache(error_handler):
+    """ハンドラ解決結果のキャッシュのテスト"""
+    class CustomToolError(ToolError):
+        pass
+    
+    error_handler.handle(CustomToolError('tool'))
+    assert error_handler._dispatch_cache[CustomToolError] is ToolError
+    
+    # 登録済みハンドラの差し替えはキャッシュ後も反映される
+    called = []
+    error_handler.handlers[ToolError] = lambda error, context: called.append('replaced')
+    error_handler.handle(CustomToolError('tool'))
+    assert called == ['replaced']
+    
+    # より近い型のハンドラを追加するとそちらが使われる
+    error_handler.handlers[CustomToolError] = lambda error, context: called.append('custom')
+    error_handler.handle(CustomToolError('tool'))
+    assert called == ['replaced', 'custom']
+
+
+def test_should_retry(error_handler):
+    """リトライ推奨判定のテスト"""
+    for error in (NetworkError('n'), ConnectionError('c'), TimeoutError('t')):
+        assert error_handler._should_retry(error, {}) is True
+        assert error_handler._should_retry(error, {'retry_count': 3}) is False
+        assert error_handler._should_retry(error, {'retry_count': 3, 'max_retries': 5}) is True
+    
+    for error in (ToolError('tool'), ConfigError('config'), ValueError('value')):
+        assert error_handler._should_retry(error, {}) is False
+
+
+def test_handle_skips_details_when_disabled(error_handler):
+    """ERRORログが無効な場合のテスト"""
+    error_handler.logger.logger.setLevel(logging.CRITICAL)
+    try:
+        result = error_handler.handle(TimeoutError('timed out'), {'retry_count': 0})
+    finally:
+        error_handler.logger.logger.setLevel(logging.NOTSET)
+    
+    assert result == {
+        'success': False,
+        'error': '[TIMEOUT] timed out',
+        'error_code': 'TIMEOUT',
+        'details': {},
+        'retry_recommended': True
+    }
+
+
+def test_error_str():
+    """エラーの文字列表現のテスト"""
+    error = ToolError('not found', {'tool': 'echo'})
+    assert str(error) == '[TOOL] not found'
+    assert str(error) is str(error)
+    assert error.message == 'not found'
+    assert error.details == {'tool': 'echo'}
+
+
+def test_error_slots():
+    """エラー属性がスロットに保持されることのテスト"""
+    error = ToolError('tool', {'tool_name': 'echo'})
+    
+    assert error.message == 'tool'
+    assert error.details == {'tool_name': 'echo'}
+    # スロットに保持されるため、インスタンスの辞書には何も格納されない
+    assert error.__dict__ == {}
+
+
+def test_error_round_trip():
+    """pickle・copyでエラー情報が保持されることのテスト"""
+    class CustomError(ConfigError):
+        pass
+    
+    error = ConfigError('x', {'a': 1})
+    error.extra = 'value'
+    
+    for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+        assert type(restored) is ConfigError
+        assert restored.message == 'x'
+        assert restored.details == {'a': 1}
+        assert restored.extra == 'value'
+        assert str(restored) == '[CFG] x'
+    
+    restored = copy.copy(CustomError('custom'))
+    assert type(restored) is CustomError
+    assert restored.details == {}
+
+
+def test_error_type_name(error_handler):
+    """エラー種別名のクラス属性のテスト"""
+    class CustomError(BaseError):
+        error_code = 'CUSTOM'
+    
+    assert BaseError.error_type_name == 'BaseError'
+    assert ToolError.error_type_name == 'ToolError'
+    assert CustomError('custom').error_type_name == 'CustomError'
+    
+    records = []
+    error_handler.logger = type('Recorder', (), {
+        'isEnabledFor': lambda self, level: True,
+        'error': lambda self, *args, **kwargs: records.append(kwargs)
+    })()
+    error_handler.handle(CustomError('custom'))
+    assert records.pop()['details']['error_type'] == 'CustomError'
@@ -0,0 +1,345 @@
+"""ロギング機能のテスト"""
+
+import asyncio
+import json
+import time
+import logging
+import pytest
+from rmf.logging import JSONFormatter, SafeRotatingFileHandler, LogContext, StructuredLogger, get_logger
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """ログファイルのパスを提供するフィクスチャ"""
+    return tmp_path / 'logs' / 'test.log'
+
+
+def make_record(message='test message', level=logging.INFO, **attrs):
+    """テスト用のログレコードを作成"""
+    record = logging.LogRecord('rmf.test', level, __file__, 1, message, None, None)
+    for key, value in attrs.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_handler_opens_file_on_first_record(log_path):
+    """ログファイルの遅延オープンのテスト"""
+    handler = SafeRotatingFileHandler(str(log_path))
+    handler.setFormatter(JSONFormatter())
+    try:
+        # ディレクトリは作成されるが、ファイルは出力まで開かない
+        assert log_path.parent.exists()
+        assert not log_path.exists()
+        
+        handler.emit(make_record(details={'key': 'value'}))
+        handler.flush()
+        
+        entry = json.loads(log_path.read_text(encoding='utf-8').strip())
+        assert entry['message'] == 'test message'
+        assert entry['details'] == {'key': 'value'}
+    finally:
+        handler.close()
+
+
+def test_formatter_output_is_json():
+    """JSONフォーマッタの出力テスト"""
+    formatter = JSONFormatter()
+    
+    # 非ASCII文字はエスケープせず、文字列以外のキーも変換できる
+    entry = formatter.format(make_record('日本語のメッセージ', details={'count': 1, 2: 'two'}))
+    assert '日本語のメッセージ' in entry
+    data = json.loads(entry)
+    assert data['level'] == 'INFO'
+    assert data['details'] == {'count': 1, '2': 'two'}
+    
+    # detailsがない場合はextra['details']を使い、辞書以外は無視する
+    assert json.loads(formatter.format(make_record(extra={'details': {'key': 'value'}})))['details'] == {'key': 'value'}
+    assert json.loads(formatter.format(make_record(details='not a dict')))['details'] == {}
+    assert json.loads(formatter.format(make_record()))['details'] == {}
+    
+    # 変換できない値はフォールバックのメッセージになる
+    data = json.loads(formatter.format(make_record(details={'value': object()})))
+    assert data['level'] == 'ERROR'
+    assert data['message'] == 'Failed to format log message'
+    assert data['original_message'] == 'test message'
+
+
+def test_formatter_without_active_exception():
+    """例外の処理中以外で記録されたexc_infoを無視することのテスト"""
+    record = make_record(exc_info=(None, None, None))
+    
+    assert 'error' not in json.loads(JSONFormatter().format(record))
+
+
+def test_formatter_time_matches_default():
+    """時刻文字列のキャッシュが標準の書式と一致することをテスト"""
+    formatter = JSONFormatter()
+    default = logging.Formatter()
+    
+    record = make_record()
+    for created in (record.created, record.created + 0.5, record.created + 61.25):
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        assert formatter.formatTime(record) == default.formatTime(record)
+
+
+def test_structured_logger_skips_disabled_levels(monkeypatch):
+    """無効なレベルのログで詳細情報を準備しないことをテスト"""
+    logger = get_logger('rmf.test.levels')
+    logger.logger.setLevel(logging.WARNING)
+    
+    calls = []
+    original = StructuredLogger._prepare_extras
+    monkeypatch.setattr(StructuredLogger, '_prepare_extras', lambda *a, **kw: calls.append(a) or original(*a, **kw))
+    
+    logger.debug('debug message', details={'key': 'value'})
+    logger.info('info message', details={'key': 'value'})
+    assert calls == []
+    
+    logger.warning('warning message', details={'key': 'value'})
+    assert len(calls) == 1
+
+
+def test_prepare_extras_merges_context():
+    """extra情報の準備のテスト"""
+    details = {'key': 'value'}
+    
+    # コンテキストがない場合はdetailsがそのまま使われる
+    logger = get_logger('rmf.test.extras')
+    assert logger._prepare_extras(details)['extra']['details'] is details
+    assert logger._prepare_extras()['extra']['details'] == {}
+    
+    # コンテキストとdetailsが結合され、元の辞書は変更されない
+    logger = get_logger('rmf.test.extras', {'environment': 'test', 'key': 'context'})
+    kwargs = logger._prepare_extras(details, extra={'other': 1})
+    assert kwargs['extra'] == {'other': 1, 'details': {'environment': 'test', 'key': 'value'}}
+    assert details == {'key': 'value'}
+    assert logger.context == {'environment': 'test', 'key': 'context'}
+
+
+def test_handler_background_writes(log_path):
+    """バックグラウンド書き込みのテスト"""
+    handler = SafeRotatingFileHandler(str(log_path))
+    handler.setFormatter(JSONFormatter())
+    try:
+        for i in range(500):
+            handler.emit(make_record(f'message {i}'))
+        
+        # flush()で書き込み待ちのレコードがすべて出力される
+        handler.flush()
+        lines = log_path.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line)['message'] for line in lines] == [f'message {i}' for i in range(500)]
+        
+        # close()でも書き込み待ちのレコードが出力される
+        handler.emit(make_record('last message'))
+    finally:
+        handler.close()
+    
+    assert json.loads(log_path.read_text(encoding='utf-8').splitlines()[-1])['message'] == 'last message'
+
+
+def test_handler_synchronous_writes(log_path):
+    """queue_size=0の場合の同期書き込みのテスト"""
+    handler = SafeRotatingFileHandler(str(log_path), queue_size=0)
+    handler.setFormatter(JSONFormatter())
+    try:
+        handler.emit(make_record())
+        
+        # フラッシュなしでも書き込まれている
+        assert handler._writer is None
+        assert json.loads(log_path.read_text(encoding='utf-8'))['message'] == 'test message'
+    finally:
+        handler.close()
+
+
+@pytest.mark.parametrize('queue_size', [0, 10000])
+def test_handler_rotates_at_max_bytes(log_path, queue_size):
+    """maxBytesに達した場合にローテーションされることのテスト"""
+    handler = SafeRotatingFileHandler(str(log_path), queue_size=queue_size, maxBytes=300, backupCount=2)
+    handler.setFormatter(JSONFormatter())
+    try:
+        for i in range(30):
+            handler.emit(make_record(f'message {i:02d}'))
+        handler.flush()
+    finally:
+        handler.close()
+    
+    backups = [log_path.with_name(f'test.log.{n}') for n in (2, 1)]
+    assert all(path.exists() for path in backups)
+    assert not log_path.with_name('test.log.3').exists()
+    
+    # 各ファイルはmaxBytes未満で、新しいレコードほど後ろのファイルに順に出力される
+    messages = []
+    for path in [*backups, log_path]:
+        assert path.stat().st_size < 300
+        messages += [json.loads(line)['message'] for line in path.read_text(encoding='utf-8').splitlines()]
+    assert messages == [f'message {i:02d}' for i in range(30 - len(messages), 30)]
+
+
+def test_handler_rotation_without_delay(log_path, monkeypatch):
+    """delay=Falseでローテーションしてもファイルが開いたまま残らないことのテスト"""
+    opened = []
+    original_open = SafeRotatingFileHandler._open
+    
+    def record_open(self):
+        stream = original_open(self)
+        opened.append(stream)
+        return stream
+    
+    monkeypatch.setattr(SafeRotatingFileHandler, '_open', record_open)
+    handler = SafeRotatingFileHandler(str(log_path), queue_size=0, maxBytes=300, backupCount=1, delay=False)
+    handler.setFormatter(JSONFormatter())
+    try:
+        for i in range(10):
+            handler.emit(make_record(f'message {i}'))
+        
+        assert len(opened) > 1
+        assert [stream.closed for stream in opened] == [True] * (len(opened) - 1) + [False]
+        assert opened[-1] is handler.stream
+    finally:
+        handler.close()
+
+
+def test_handler_tracks_size_without_tell(log_path, monkeypatch):
+    """ローテーション判定でレコードごとにtell()を呼ばないことのテスト"""
+    log_path.parent.mkdir(parents=True)
+    log_path.write_bytes(b'x' * 100)
+    handler = SafeRotatingFileHandler(str(log_path), queue_size=0, maxBytes=300, backupCount=1)
+    handler.setFormatter(JSONFormatter())
+    try:
+        handler.emit(make_record('first'))
+        
+        # 既存のファイルサイズはストリームを開いた時点で一度だけ取得する
+        assert handler._stream_size == log_path.stat().st_size
+        
+        def fail_tell():
+            raise AssertionError('tell() called')
+        monkeypatch.setattr(handler.stream, 'tell', fail_tell, raising=False)
+        handler.emit(make_record('second'))
+        assert handler._stream_size == log_path.stat().st_size
+    finally:
+        handler.close()
+
+
+def test_handler_fsync_interval(log_path, monkeypatch):
+    """fsyncが一定間隔でのみ実行されることをテスト"""
+    synced = []
+    monkeypatch.setattr('rmf.logging.PlatformUtils.is_windows', staticmethod(lambda: True))
+    monkeypatch.setattr('rmf.logging.os.fsync', lambda fd: synced.append(fd))
+    
+    handler = SafeRotatingFileHandler(
+        str(log_path), queue_size=0, fsync_interval_records=3, fsync_interval_s=3600
+    )
+    handler.setFormatter(JSONFormatter())
+    try:
+        for _ in range(7):
+            handler.emit(make_record())
+        assert len(synced) == 2
+    finally:
+        handler.close()
+    
+    # クローズ時には必ずfsyncする
+    assert len(synced) == 3
+
+
+def test_log_context_adds_details():
+    """LogContextがログの詳細情報にコンテキストを追加することをテスト"""
+    logger = get_logger('rmf.test.context', {'environment': 'test'})
+    
+    with LogContext(test_name='outer'):
+        with LogContext(request_id='abc'):
+            details = logger._prepare_extras({'key': 'value'})['extra']['details']
+            assert details == {'environment': 'test', 'test_name': 'outer', 'request_id': 'abc', 'key': 'value'}
+        
+        # 内側のコンテキストを抜けると外側の状態に戻る
+        assert logger._prepare_extras()['extra']['details'] == {'environment': 'test', 'test_name': 'outer'}
+    
+    # ロガー自身のコンテキストは変更されない
+    assert logger.context == {'environment': 'test'}
+    assert logger._prepare_extras()['extra']['details'] == {'environment': 'test'}
+
+
+@pytest.mark.asyncio
+async def test_log_context_is_task_local():
+    """LogContextがasyncioタスクごとに独立していることをテスト"""
+    logger = get_logger('rmf.test.context')
+    
+    async def run(name):
+        with LogContext(test_name=name):
+            await asyncio.sleep(0)
+            return logger._prepare_extras()['extra']['details']
+    
+    results = await asyncio.gather(run('first'), run('second'))
+    assert results == [{'test_name': 'first'}, {'test_name': 'second'}]
+
+
+def test_structured_logger_lazy_arguments():
+    """%形式の引数がログ出力時に展開されることをテスト"""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    
+    logger = get_logger('rmf.test.arguments')
+    logger.logger.setLevel(logging.INFO)
+    logger.logger.addHandler(handler)
+    try:
+        logger.info('tool %s returned %d items', 'echo', 3, details={'key': 'value'})
+        try:
+            raise ValueError('bad')
+        except ValueError as e:
+            logger.error('failed: %s', 'reason', error=e)
+    finally:
+        logger.logger.removeHandler(handler)
+    
+    assert records[0].getMessage() == 'tool echo returned 3 items'
+    assert records[0].details == {'key': 'value'}
+    assert records[1].getMessage() == 'failed: reason'
+    assert records[1].details == {'error_type': 'ValueError', 'error_message': 'bad'}
+
+
+def test_handler_writes_utf8_bytes(log_path):
+    """バイナリモードでのUTF-8書き込みのテスト"""
+    handler = SafeRotatingFileHandler(str(log_path), queue_size=0)
+    handler.setFormatter(JSONFormatter())
+    try:
+        handler.emit(make_record('日本語のメッセージ'))
+        
+        # JSON以外のフォーマッタでも書き込める
+        handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        handler.emit(make_record('テキスト形式'))
+    finally:
+        handler.close()
+    
+    lines = log_path.read_bytes().decode('utf-8').split('\n')
+    assert json.loads(lines[0])['message'] == '日本語のメッセージ'
+    assert lines[1:] == ['INFO テキスト形式', '']
+
+
+def test_handler_flushes_buffer_when_idle(log_path):
+    """書き込みが止まるとバッファの内容がファイルに出力されることをテスト"""
+    handler = SafeRotatingFileHandler(str(log_path), flush_interval_s=0.05)
+    handler.setFormatter(JSONFormatter())
+    try:
+        handler.emit(make_record())
+        
+        # flush()を呼ばなくても書き込みスレッドがフラッシュする
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if log_path.exists() and log_path.read_bytes().endswith(b'\n'):
+                break
+            time.sleep(0.01)
+        assert json.loads(log_path.read_text(encoding='utf-8'))['message'] == 'test message'
+    finally:
+        handler.close()
+
+
+def test_handler_recreates_missing_directory(log_path):
+    """初期化後に削除されたディレクトリを再作成することをテスト"""
+    handler = SafeRotatingFileHandler(str(log_path), queue_size=0)
+    handler.setFormatter(JSONFormatter())
+    try:
+        log_path.parent.rmdir()
+        handler.emit(make_record())
+        assert json.loads(log_path.read_text(encoding='utf-8'))['message'] == 'test message'
+    finally:
+        handler.close()
@@ -4,6 +4,7 @@ import os
 import sys
 import time
 import shutil
+import stat
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -18,10 +19,10 @@ def temp_dir(tmp_path):
 
 def test_is_windows():
     """Windows環境判定のテスト"""
-    with patch('os.name', 'nt'):
+    with patch('rmf.platform._IS_WINDOWS', True):
         assert PlatformUtils.is_windows() is True
     
-    with patch('os.name', 'posix'):
+    with patch('rmf.platform._IS_WINDOWS', False):
         assert PlatformUtils.is_windows() is False
 
 
@@ -115,6 +116,69 @@ def test_safe_file_write(temp_dir):
     with patch('os.fsync', side_effect=mock_fsync):
         PlatformUtils.safe_file_write(test_file, 'new content')
         assert test_file.read_text(encoding='utf-8') == 'new content'
+    
+    # 一時ファイルが残らないことの確認
+    assert sorted(p.name for p in temp_dir.iterdir()) == ['nested', 'test.txt']
+
+
+def test_safe_file_write_atomic(temp_dir):
+    """書き込み失敗時に既存ファイルが保持されることのテスト"""
+    test_file = temp_dir / 'test.txt'
+    PlatformUtils.safe_file_write(test_file, 'old content')
+    
+    with patch('os.replace', side_effect=OSError()):
+        with pytest.raises(OSError):
+            PlatformUtils.safe_file_write(test_file, 'new content')
+    
+    assert test_file.read_text(encoding='utf-8') == 'old content'
+    assert [p.name for p in temp_dir.iterdir()] == ['test.txt']
+
+
+def test_safe_file_write_not_durable(temp_dir):
+    """durable=Falseではfsyncを呼ばないことのテスト"""
+    test_file = temp_dir / 'test.txt'
+    with patch('os.fsync') as mock_fsync:
+        PlatformUtils.safe_file_write(test_file, 'content', durable=False)
+    
+    mock_fsync.assert_not_called()
+    assert test_file.read_text(encoding='utf-8') == 'content'
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIXのパーミッションが必要")
+def test_safe_file_write_keeps_mode(temp_dir):
+    """既存ファイルのパーミッションが保持されることのテスト"""
+    test_file = temp_dir / 'test.txt'
+    test_file.write_text('old content', encoding='utf-8')
+    test_file.chmod(0o640)
+    
+    PlatformUtils.safe_file_write(test_file, 'new content')
+    
+    assert stat.S_IMODE(test_file.stat().st_mode) == 0o640
+    
+    # 新規ファイルはumaskに従ったパーミッションになる（umaskを取得できない環境では0600）
+    umask = os.umask(0o027)
+    try:
+        # プロセス全体のumaskは変更しない
+        with patch('os.umask', side_effect=AssertionError('umask changed')):
+            PlatformUtils.safe_file_write(temp_dir / 'new.txt', 'content')
+    finally:
+        os.umask(umask)
+    expected = 0o640 if os.path.exists('/proc/self/status') else 0o600
+    assert stat.S_IMODE((temp_dir / 'new.txt').stat().st_mode) == expected
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="シンボリックリンクの作成に権限が必要")
+def test_safe_file_write_symlink(temp_dir):
+    """シンボリックリンクのリンク先に書き込まれることのテスト"""
+    target = temp_dir / 'target.txt'
+    target.write_text('old content', encoding='utf-8')
+    link = temp_dir / 'link.txt'
+    link.symlink_to(target)
+    
+    PlatformUtils.safe_file_write(link, 'new content')
+    
+    assert link.is_symlink()
+    assert target.read_text(encoding='utf-8') == 'new content'
 
 
 def test_safe_file_read(temp_dir):
@@ -130,10 +194,10 @@ def test_safe_file_read(temp_dir):
     assert PlatformUtils.safe_file_read(temp_dir / 'not_exists.txt') is None
     
     # 読み込みエラーのテスト
-    def mock_open(*args, **kwargs):
+    def mock_read_text(*args, **kwargs):
         raise PermissionError()
     
-    with patch('builtins.open', side_effect=mock_open):
+    with patch.object(Path, 'read_text', side_effect=mock_read_text):
         assert PlatformUtils.safe_file_read(test_file) is None
 
 
@@ -168,4 +232,44 @@ def test_windows_specific_behaviors(temp_dir):
         # クリーンアップ
         handle.Close()
         # ロック解除後は削除できることを確認
-        assert PlatformUtils.safe_rmtree(test_dir) is True 
\ No newline at end of file
+        assert PlatformUtils.safe_rmtree(test_dir) is True 
+
+def test_get_safe_path_cache(temp_dir, monkeypatch):
+    """パス解決のキャッシュのテスト"""
+    # 相対パスはカレントディレクトリごとに解決される
+    (temp_dir / 'a').mkdir()
+    (temp_dir / 'b').mkdir()
+    monkeypatch.chdir(temp_dir / 'a')
+    first = PlatformUtils.get_safe_path('cached.log')
+    monkeypatch.chdir(temp_dir / 'b')
+    second = PlatformUtils.get_safe_path('cached.log')
+    
+    assert first == str((temp_dir / 'a' / 'cached.log').resolve())
+    assert second == str((temp_dir / 'b' / 'cached.log').resolve())
+    
+    # Pathオブジェクトも受け付ける
+    assert PlatformUtils.get_safe_path(temp_dir / 'a' / 'cached.log') == first
+
+
+def test_safe_rmtree_clears_read_only_on_windows(temp_dir):
+    """Windows分岐で読み取り専用属性が再帰的に解除されることのテスト"""
+    test_dir = temp_dir / 'readonly_dir'
+    nested = test_dir / 'nested'
+    nested.mkdir(parents=True)
+    files = [test_dir / 'a.txt', nested / 'b.txt']
+    for f in files:
+        f.write_text('test')
+        f.chmod(0o444)
+    
+    modes = []
+    real_rmtree = shutil.rmtree
+    
+    def record_rmtree(path, *args, **kwargs):
+        modes.extend(f.stat().st_mode & 0o777 for f in files)
+        real_rmtree(path, *args, **kwargs)
+    
+    with patch('rmf.platform._IS_WINDOWS', True), \
+         patch('rmf.platform.shutil.rmtree', record_rmtree):
+        assert PlatformUtils.safe_rmtree(test_dir) is True
+    
+    assert modes == [0o777, 0o777]
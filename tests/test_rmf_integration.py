@@ -1,13 +1,16 @@
 """RMF統合テスト"""
 
 import os
+import importlib.util
 import json
+import logging
 import pytest
 import aiohttp
 import asyncio
 from typing import Dict, Any
 from aiohttp import web
 from rmf import RMF, RMFError, TimeoutError, ConnectionError, ToolError, LogContext
+from rmf.rmf import _retry_on
 
 # テスト用の設定
 TEST_CONFIG = {
@@ -27,9 +30,16 @@ TEST_CONFIG = {
     ]
 }
 
+# 本文付きで応答したETag付きツール一覧リクエストの記録
+ETAG_RESPONSES = []
+
+# ツール一覧リクエストの記録
+TOOLS_LIST_REQUESTS = []
+
 # モックサーバーのルート
 async def handle_tools_list(request):
     """ツール一覧エンドポイントのハンドラ"""
+    TOOLS_LIST_REQUESTS.append(request.path)
     return web.json_response([
         {
             "name": "test_tool",
@@ -48,6 +58,36 @@ async def handle_tools_call(request):
         "result": f"Called {data['tool']} with {data['arguments']}"
     })
 
+async def handle_tools_list_etag(request):
+    """ETag付きツール一覧エンドポイントのハンドラ"""
+    if request.headers.get("If-None-Match") == '"v1"':
+        raise web.HTTPNotModified()
+    ETAG_RESPONSES.append(request.path)
+    return web.json_response([{"name": "etag_tool"}], headers={"ETag": '"v1"'})
+
+async def handle_tools_call_stream(request):
+    """JSON Linesで結果を分割して返すツール呼び出しエンドポイントのハンドラ"""
+    data = await request.json()
+    if data["tool"] == "json_seq_tool":
+        # RFC 7464のJSON Text Sequences（各レコードの先頭にRS）
+        body = b"".join(b"\x1e" + json.dumps({"index": i}).encode() + b"\n" for i in range(3))
+        return web.Response(body=body, content_type="application/json-seq")
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+    await response.prepare(request)
+    if data["tool"] == "malformed_tool":
+        await response.write(b'{"index": 0}\n{"index": \n')
+        await response.write_eof()
+        return response
+    for i in range(3):
+        # 1件の途中で送信を区切っても正しく解析されることを確認する
+        line = json.dumps({"index": i, "tool": data["tool"]}).encode() + b"\n"
+        await response.write(line[:5])
+        if data["tool"] == "slow_tool":
+            await asyncio.sleep(0.4)
+        await response.write(line[5:])
+    await response.write_eof()
+    return response
+
 async def handle_service_unavailable(request):
     """503エラーを返すハンドラ"""
     raise web.HTTPServiceUnavailable()
@@ -65,6 +105,8 @@ async def mock_server():
     app.router.add_post('/tools/call', handle_tools_call)
     app.router.add_get('/error/503', handle_service_unavailable)
     app.router.add_get('/timeout/tools/list', handle_timeout)
+    app.router.add_get('/etag/tools/list', handle_tools_list_etag)
+    app.router.add_post('/stream/tools/call', handle_tools_call_stream)
     
     runner = web.AppRunner(app)
     await runner.setup()
@@ -83,6 +125,96 @@ async def rmf_client():
     yield client
     await client.cleanup()
 
+def test_merge_config():
+    """設定マージのテスト"""
+    client = RMF({
+        **TEST_CONFIG,
+        "logging": {"level": "DEBUG"},
+        "retry": {"max_attempts": 5}
+    })
+    
+    # 指定したキーのみ上書きされ、残りはデフォルト値
+    assert client.config["logging"] == {"level": "DEBUG", "file": "rmf.log", "format": "json"}
+    assert client.config["retry"]["max_attempts"] == 5
+    assert client.config["retry"]["initial_delay"] == 0.1
+    assert client.config["timeouts"] == RMF.DEFAULT_CONFIG["timeouts"]
+    
+    # デフォルト設定は変更されない
+    assert client.config["timeouts"] is not RMF.DEFAULT_CONFIG["timeouts"]
+    assert RMF.DEFAULT_CONFIG["logging"]["level"] == "INFO"
+
+def test_find_mcp():
+    """MCP名による呼び出し先選択のテスト"""
+    client = RMF({"remote_mcps": [
+        {"name": "first", "base_url": "http://localhost:8001"},
+        {"name": "second", "base_url": "http://localhost:8002"},
+        {"name": "first", "base_url": "http://localhost:8003"}
+    ]})
+    
+    # 名前の指定がなければ最初のMCP、同名の場合は先に設定されたMCPを使用
+    assert client._find_mcp(None)["base_url"] == "http://localhost:8001"
+    assert client._find_mcp("second")["base_url"] == "http://localhost:8002"
+    assert client._find_mcp("first")["base_url"] == "http://localhost:8001"
+    
+    with pytest.raises(ValueError):
+        client._find_mcp("missing")
+
+def test_prepare_mcp():
+    """リクエスト用の値の事前作成のテスト"""
+    client = RMF({"remote_mcps": [
+        {"name": "test", "base_url": "http://localhost:8003/", "headers": {"Authorization": "token"}}
+    ]})
+    mcp = client._find_mcp("test")
+    
+    assert mcp["timeout"] == 5.0
+    assert mcp["_tools_list_url"] == "http://localhost:8003/tools/list"
+    assert mcp["_tools_call_url"] == "http://localhost:8003/tools/call"
+    assert mcp["_tools_call_headers"] == {"Content-Type": "application/json", "Authorization": "token"}
+    assert mcp["_client_timeout"].total == 5.0
+    assert mcp["_client_timeout"].connect == RMF.DEFAULT_CONFIG["timeouts"]["connect"]
+    assert mcp["_client_timeout"].sock_read == RMF.DEFAULT_CONFIG["timeouts"]["read"]
+    assert mcp["_stream_timeout"].total is None
+    assert mcp["_stream_timeout"].sock_read == RMF.DEFAULT_CONFIG["timeouts"]["read"]
+
+def test_prepare_mcp_copies_config():
+    """呼び出し側のMCP設定が変更されないことのテスト"""
+    user_mcp = {"name": "test", "base_url": "http://localhost:8003/"}
+    mcps = [user_mcp]
+    client = RMF({"remote_mcps": mcps})
+    
+    assert user_mcp == {"name": "test", "base_url": "http://localhost:8003/"}
+    assert mcps == [user_mcp]
+    assert client._find_mcp("test") is not user_mcp
+    assert client._find_mcp("test")["_tools_list_url"] == "http://localhost:8003/tools/list"
+
+def test_client_timeout_per_client():
+    """同じMCP設定を共有するクライアントごとにタイムアウトが作られることのテスト"""
+    user_mcp = {"name": "test", "base_url": "http://localhost:8003"}
+    fast = RMF({"remote_mcps": [user_mcp], "timeouts": {"connect": 1.0, "read": 2.0}})
+    slow = RMF({"remote_mcps": [user_mcp], "timeouts": {"connect": 5.0, "read": 60.0}})
+    
+    assert "_client_timeout" not in user_mcp
+    assert fast._find_mcp("test")["_client_timeout"].sock_read == 2.0
+    assert slow._find_mcp("test")["_client_timeout"].sock_read == 60.0
+
+@pytest.mark.asyncio
+async def test_setup_connector():
+    """コネクションプール設定のテスト"""
+    client = RMF({**TEST_CONFIG, "connection": {"keepalive_timeout": 30.0}})
+    await client.setup()
+    try:
+        connector = client._session.connector
+        assert connector.limit == 100
+        assert connector.limit_per_host == 32
+        assert connector._keepalive_timeout == 30.0
+        
+        # aiodnsがある場合のみ非同期リゾルバを使用する
+        has_aiodns = importlib.util.find_spec("aiodns") is not None
+        expected = aiohttp.AsyncResolver if has_aiodns else aiohttp.ThreadedResolver
+        assert isinstance(connector._resolver, expected)
+    finally:
+        await client.cleanup()
+
 @pytest.mark.asyncio
 async def test_get_tools_success(mock_server, rmf_client):
     """ツール一覧取得の成功テスト"""
@@ -91,6 +223,93 @@ async def test_get_tools_success(mock_server, rmf_client):
         assert len(tools) == 1
         assert tools[0]["name"] == "test_tool"
 
+@pytest.mark.asyncio
+async def test_get_tools_concurrent():
+    """複数MCPからのツール一覧の並行取得のテスト"""
+    client = RMF({"remote_mcps": [
+        {"name": "first", "base_url": "http://localhost:8003"},
+        {"name": "second", "base_url": "http://localhost:8003"}
+    ]})
+    
+    async def fetch(mcp_config):
+        await asyncio.sleep(0.2 if mcp_config["name"] == "first" else 0.1)
+        return [{"name": mcp_config["name"]}]
+    
+    client._fetch_tools_from_remote = fetch
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    tools = await client.get_tools()
+    
+    # 並行して実行され、結果はMCPの設定順に並ぶ
+    assert loop.time() - start < 0.3
+    assert tools == [{"name": "first"}, {"name": "second"}]
+    
+    async def fail(mcp_config):
+        raise ConnectionError(mcp_config["name"])
+    
+    client._fetch_tools_from_remote = fail
+    with pytest.raises(ConnectionError):
+        await client.get_tools()
+
+@pytest.mark.asyncio
+async def test_get_tools_cache(mock_server, rmf_client):
+    """ツール一覧キャッシュのテスト"""
+    TOOLS_LIST_REQUESTS.clear()
+    tools = await rmf_client.get_tools()
+    assert len(TOOLS_LIST_REQUESTS) == 1
+    
+    # 有効期限内はキャッシュから返される
+    assert await rmf_client.get_tools() == tools
+    assert len(TOOLS_LIST_REQUESTS) == 1
+    
+    # キャッシュを破棄すると再取得される
+    rmf_client.invalidate_tools("Test MCP")
+    assert await rmf_client.get_tools() == tools
+    assert len(TOOLS_LIST_REQUESTS) == 2
+    
+    # 有効期限が切れたキャッシュは使用されない
+    rmf_client.config["tools_cache_ttl"] = 0
+    assert await rmf_client.get_tools() == tools
+    assert len(TOOLS_LIST_REQUESTS) == 3
+
+@pytest.mark.asyncio
+async def test_get_tools_etag(mock_server, rmf_client):
+    """ETagによるツール一覧の再検証のテスト"""
+    ETAG_RESPONSES.clear()
+    rmf_client.config["tools_cache_ttl"] = 0
+    mcp_config = {
+        "name": "ETag Test MCP",
+        "base_url": "http://localhost:8003/etag",
+        "timeout": 1,
+        "headers": None
+    }
+    
+    tools = await rmf_client._fetch_tools_from_remote(mcp_config)
+    assert tools == [{"name": "etag_tool"}]
+    
+    # 2回目は304応答となり、キャッシュ済みの一覧が返される
+    assert await rmf_client._fetch_tools_from_remote(mcp_config) is tools
+    assert len(ETAG_RESPONSES) == 1
+
+@pytest.mark.asyncio
+async def test_write_tool_invalidates_cache(mock_server):
+    """状態を変更するツールの呼び出しによるキャッシュ破棄のテスト"""
+    client = RMF({"remote_mcps": [
+        {"name": "Write MCP", "base_url": "http://localhost:8003", "write_tools": ["update_tool"]}
+    ]})
+    async with client:
+        await client.get_tools()
+        
+        # 読み取り専用のツールではキャッシュを保持する
+        await client.call_tool("test_tool", {})
+        assert "Write MCP" in client._tools_cache
+        
+        await client.call_tool("update_tool", {})
+        assert "Write MCP" not in client._tools_cache
+        
+        assert client.is_write_tool("update_tool")
+        assert not client.is_write_tool("test_tool")
+
 @pytest.mark.asyncio
 async def test_call_tool_success(mock_server, rmf_client):
     """ツール呼び出しの成功テスト"""
@@ -101,6 +320,123 @@ async def test_call_tool_success(mock_server, rmf_client):
         )
         assert "Called test_tool" in result["result"]
 
+@pytest.mark.asyncio
+async def test_call_tool_deduplicates_inflight():
+    """実行中の同一呼び出しの共有のテスト"""
+    client = RMF({"remote_mcps": [
+        {"name": "test", "base_url": "http://localhost:8003",
+         "write_tools": ["update_tool"], "dedupe_tools": ["test_tool", "update_tool"]}
+    ]})
+    calls = []
+    
+    async def call_remote_tool(mcp_config, tool, arguments):
+        calls.append((tool, arguments))
+        await asyncio.sleep(0.05)
+        return {"tool": tool, "items": []}
+    
+    client._call_remote_tool = call_remote_tool
+    
+    # 引数のキーの順序が異なっても同一の呼び出しとして共有する
+    results = await asyncio.gather(
+        client.call_tool("test_tool", {"a": 1, "b": 2}),
+        client.call_tool("test_tool", {"b": 2, "a": 1}),
+        client.call_tool("test_tool", {"a": 2, "b": 2})
+    )
+    assert len(calls) == 2
+    assert results[0] == results[1]
+    assert client._inflight == {}
+    
+    # 共有した結果は呼び出し元ごとのコピー
+    results[0]["items"].append(1)
+    assert results[1]["items"] == []
+    
+    # dedupe_toolsに指定されていないツールと、状態を変更するツールは共有しない
+    for tool in ("other_tool", "update_tool"):
+        calls.clear()
+        await asyncio.gather(client.call_tool(tool, {}), client.call_tool(tool, {}))
+        assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_call_tools_batch():
+    """ツールの一括呼び出しのテスト"""
+    client = RMF(TEST_CONFIG)
+    running = []
+    max_running = []
+    
+    async def call_tool(tool, arguments, mcp_name=None):
+        running.append(tool)
+        max_running.append(len(running))
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            running.remove(tool)
+        if tool == "fail":
+            raise ToolError(tool)
+        return {"tool": tool, "arguments": arguments}
+    
+    client.call_tool = call_tool
+    
+    # 同時実行数を制限しつつ、呼び出し順に結果を返す
+    calls = [(f"tool{i}", {"index": i}) for i in range(5)]
+    results = await client.call_tools_batch(calls, concurrency=2)
+    assert results == [{"tool": tool, "arguments": arguments} for tool, arguments in calls]
+    assert max(max_running) == 2
+    
+    # 失敗した場合は残りの呼び出しを取り消して例外を送出する
+    with pytest.raises(ToolError):
+        await client.call_tools_batch([("fail", {}), ("tool1", {}), ("tool2", {})], concurrency=1)
+    assert running == []
+
+@pytest.mark.asyncio
+async def test_call_tool_result_logging(mock_server, rmf_client, monkeypatch):
+    """ツールの実行結果は本文ではなくサイズと形だけを記録することのテスト"""
+    from rmf.logging import StructuredLogger
+    
+    records = []
+    monkeypatch.setattr(StructuredLogger, 'info', lambda self, message, *args, details=None, **kwargs: records.append((message, details)))
+    base_logger = logging.getLogger('rmf.rmf')
+    level = base_logger.level
+    try:
+        base_logger.setLevel(logging.DEBUG)
+        result = await rmf_client.call_tool("test_tool", {"param1": "value1"})
+        details = dict(records)["ツール呼び出し成功"]
+        assert details == {"result_bytes": len(json.dumps(result)), "result_keys": ["result"]}
+    finally:
+        base_logger.setLevel(level)
+
+@pytest.mark.asyncio
+async def test_call_tool_stream(mock_server):
+    """ツールのストリーミング呼び出しのテスト"""
+    client = RMF({"remote_mcps": [
+        *TEST_CONFIG["remote_mcps"],
+        {"name": "Stream MCP", "base_url": "http://localhost:8003/stream", "timeout": 1}
+    ]})
+    async with client:
+        # JSON Linesは1行ごとに返される
+        results = [item async for item in client.call_tool_stream("test_tool", {}, mcp_name="Stream MCP")]
+        assert results == [{"index": i, "tool": "test_tool"} for i in range(3)]
+        
+        # 通常のJSONは本文全体が1つの値として返される
+        results = [item async for item in client.call_tool_stream("test_tool", {"param1": "value1"})]
+        assert len(results) == 1
+        assert "Called test_tool" in results[0]["result"]
+        
+        # 全体の所要時間がMCPのtimeoutを超えても、受信が続いていればタイムアウトしない
+        results = [item async for item in client.call_tool_stream("slow_tool", {}, mcp_name="Stream MCP")]
+        assert results == [{"index": i, "tool": "slow_tool"} for i in range(3)]
+        
+        # JSON Text Sequencesはレコード区切り文字を除いて解析される
+        results = [item async for item in client.call_tool_stream("json_seq_tool", {}, mcp_name="Stream MCP")]
+        assert results == [{"index": i} for i in range(3)]
+        
+        # 解析できない行はToolErrorとして報告される
+        results = []
+        with pytest.raises(ToolError) as exc_info:
+            async for item in client.call_tool_stream("malformed_tool", {}, mcp_name="Stream MCP"):
+                results.append(item)
+        assert results == [{"index": 0}]
+        assert exc_info.value.details["line"] == 2
+
 @pytest.mark.asyncio
 async def test_retry_mechanism_integration(mock_server, rmf_client):
     """リトライメカニズムの統合テスト"""
@@ -113,17 +449,65 @@ async def test_retry_mechanism_integration(mock_server, rmf_client):
                 "headers": None
             })
 
+@pytest.mark.asyncio
+async def test_retry_on(monkeypatch):
+    """リトライ回数と待機時間のテスト"""
+    delays = []
+    
+    async def record_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr('rmf.rmf.asyncio.sleep', record_sleep)
+    
+    class Flaky:
+        config = {"retry": {"max_attempts": 4, "initial_delay": 0.1, "max_delay": 0.5}}
+        calls = 0
+        
+        @_retry_on(ToolError)
+        async def run(self, succeed_at):
+            self.calls += 1
+            if self.calls < succeed_at:
+                raise ToolError("flaky")
+            return "ok"
+    
+    # 成功するまでリトライする
+    assert await Flaky().run(3) == "ok"
+    assert len(delays) == 2
+    assert all(0.1 <= delay <= 0.5 for delay in delays)
+    
+    # 最大試行回数に達すると例外を送出する
+    flaky = Flaky()
+    with pytest.raises(ToolError):
+        await flaky.run(10)
+    assert flaky.calls == 4
+    
+    # 対象外の例外はリトライしない
+    flaky = Flaky()
+    
+    @_retry_on(TimeoutError)
+    async def fail(self):
+        self.calls += 1
+        raise ToolError("not retried")
+    
+    with pytest.raises(ToolError):
+        await fail(flaky)
+    assert flaky.calls == 1
+
 @pytest.mark.asyncio
 async def test_timeout_handling(mock_server, rmf_client):
     """タイムアウト処理のテスト"""
     with LogContext(test_name="test_timeout_handling"):
+        mcp_config = {
+            "name": "Timeout Test MCP",
+            "base_url": "http://localhost:8003/timeout",  # タイムアウトをシミュレートするエンドポイント
+            "timeout": 1,
+            "headers": None
+        }
         with pytest.raises(TimeoutError):
-            await rmf_client._fetch_tools_from_remote({
-                "name": "Timeout Test MCP",
-                "base_url": "http://localhost:8003/timeout",  # タイムアウトをシミュレートするエンドポイント
-                "timeout": 1,
-                "headers": None
-            })
+            await rmf_client._fetch_tools_from_remote(mcp_config)
+        
+        # 渡した設定にはリクエスト用の値が追加されない
+        assert not any(key.startswith("_") for key in mcp_config)
 
 @pytest.mark.asyncio
 async def test_connection_error_handling(mock_server, rmf_client):